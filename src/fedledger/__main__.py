@@ -0,0 +1,9 @@
+"""Allow running the CLI with ``python -m fedledger``."""
+
+import sys
+
+from fedledger.cli import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
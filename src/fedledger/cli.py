@@ -6,24 +6,124 @@ querying document metadata.
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Iterable, List, Optional, Tuple
 import argparse
 import json
+from itertools import islice
 
-from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich.panel import Panel
-from rich import print as rprint
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from fedledger.config import FedLedgerConfig
 from fedledger.logging_config import setup_logging, get_logger
-from fedledger.pipeline import Pipeline
-from fedledger.pydantic_models import DocumentType
+from fedledger.metadata_index import lookup_document
+from fedledger.parquet_stats import collect_parquet_stats, scan_parquet_files
 
 
-console = Console()
+# Rich, PyArrow and the pipeline are imported lazily inside the command
+# handlers so that short invocations (--help, info) stay fast.
+_console = None
+
+
+def _get_console():
+    """Return the shared rich Console, creating it on first use.
+    
+    Returns:
+        Cached rich.console.Console instance.
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+def __getattr__(name: str):
+    """Resolve the lazily created module-level ``console`` attribute."""
+    if name == "console":
+        return _get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+SYNC_TYPE_CHOICES = ["statements", "minutes", "speeches", "press_conferences", "all"]
+LIST_FORMAT_CHOICES = ["table", "json", "csv"]
+
+# CLI --type names to DocumentType values (kept as strings so the models
+# module is only imported by cmd_sync)
+_DOC_TYPE_MAP = {
+    "statements": "statement",
+    "minutes": "minutes",
+    "speeches": "speech",
+    "press_conferences": "press_conference",
+}
+LIST_TABLE_COLUMNS = ["doc_id", "title", "published_date", "doc_type"]
+LIST_TABLE_ROWS = 20
+
+# Subcommand grammar for the fast parser, mirroring setup_argparser():
+# (positionals, store_true flags, valued options -> (dest, type, choices, default))
+_FAST_COMMAND_SPECS = {
+    "sync": (
+        (("source", Path),),
+        {
+            "--dry-run": "dry_run",
+            "--save-raw": "save_raw",
+            "--parallel": "parallel",
+            "--overwrite": "overwrite",
+        },
+        {
+            "--type": ("type", str, SYNC_TYPE_CHOICES, "statements"),
+            "--limit": ("limit", int, None, None),
+            "--workers": ("workers", int, None, 4),
+        },
+    ),
+    "list": (
+        (),
+        {},
+        {
+            "--type": ("type", str, None, None),
+            "--format": ("format", str, LIST_FORMAT_CHOICES, "table"),
+        },
+    ),
+    "info": ((("doc_id", str),), {}, {}),
+    "stats": ((), {}, {}),
+}
+
+
+# Pre-rendered output of setup_argparser().format_help() at 80 columns, so
+# "fedledger", "fedledger -h" and "fedledger --help" skip building the parser.
+# tests/test_cli.py checks it against the live parser.
+_STATIC_HELP = """\
+usage: fedledger [-h] [--data-dir DATA_DIR] [--verbose] [--log-json]
+                 {sync,list,info,stats} ...
+
+Fed Policy Ledger - Archive Federal Reserve policy communications
+
+positional arguments:
+  {sync,list,info,stats}
+                        Available commands
+    sync                Process documents from local directory or remote
+                        sources
+    list                List processed documents
+    info                Show detailed information about a document
+    stats               Show archive statistics
+
+options:
+  -h, --help            show this help message and exit
+  --data-dir DATA_DIR   Base directory for data storage (default: ./data)
+  --verbose, -v         Enable verbose output
+  --log-json            Output structured JSON logs
+
+Examples:
+  fedledger sync data/fixtures --type statements --limit 10
+  fedledger sync data/fixtures --type speeches --parallel --save-raw
+  fedledger list --format table
+  fedledger info <doc_id>
+        
+"""
 
 
 def setup_argparser() -> argparse.ArgumentParser:
@@ -79,7 +179,7 @@ Examples:
     )
     sync_parser.add_argument(
         "--type",
-        choices=["statements", "minutes", "speeches", "press_conferences", "all"],
+        choices=SYNC_TYPE_CHOICES,
         default="statements",
         help="Type of documents to process (default: statements)"
     )
@@ -126,7 +226,7 @@ Examples:
     )
     list_parser.add_argument(
         "--format",
-        choices=["table", "json", "csv"],
+        choices=LIST_FORMAT_CHOICES,
         default="table",
         help="Output format (default: table)"
     )
@@ -150,6 +250,108 @@ Examples:
     return parser
 
 
+def _fast_parse_args(argv: List[str]) -> Optional[argparse.Namespace]:
+    """Parse common command lines without building the argparse tree.
+    
+    Only handles the plain ``[global options] <command> [options]`` form.
+    Anything else (help flags, ``--opt=value``, abbreviations, bad values)
+    returns None so the caller can fall back to setup_argparser() and get
+    argparse's usual help and error reporting.
+    
+    Args:
+        argv: Command-line arguments, excluding the program name.
+    
+    Returns:
+        Parsed arguments, or None if argparse should handle the command line.
+    """
+    values = {"data_dir": Path("data"), "verbose": False, "log_json": False}
+    
+    i = 0
+    while i < len(argv) and argv[i] not in _FAST_COMMAND_SPECS:
+        token = argv[i]
+        if token in ("--verbose", "-v"):
+            values["verbose"] = True
+        elif token == "--log-json":
+            values["log_json"] = True
+        elif token == "--data-dir" and i + 1 < len(argv):
+            i += 1
+            values["data_dir"] = Path(argv[i])
+        else:
+            return None
+        i += 1
+    
+    if i == len(argv):
+        return None
+    
+    command = argv[i]
+    positionals, flags, options = _FAST_COMMAND_SPECS[command]
+    values["command"] = command
+    values.update({dest: False for dest in flags.values()})
+    values.update({dest: default for dest, _, _, default in options.values()})
+    
+    remaining = list(positionals)
+    i += 1
+    while i < len(argv):
+        token = argv[i]
+        if token in flags:
+            values[flags[token]] = True
+        elif token in options and i + 1 < len(argv):
+            dest, convert, choices, _ = options[token]
+            i += 1
+            try:
+                value = convert(argv[i])
+            except ValueError:
+                return None
+            if choices is not None and value not in choices:
+                return None
+            values[dest] = value
+        elif token.startswith("-") or not remaining:
+            return None
+        else:
+            dest, convert = remaining.pop(0)
+            values[dest] = convert(token)
+        i += 1
+    
+    if remaining:
+        return None
+    
+    return argparse.Namespace(**values)
+
+
+def _json_default(value):
+    """Serialize values the json module cannot handle (e.g. timestamps)."""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def _dump_json_record(record: dict) -> bytes:
+    """Encode one record as UTF-8 JSON, indented as an element of a list.
+    
+    Uses orjson when installed, falling back to the json module.
+    """
+    if orjson is not None:
+        data = orjson.dumps(record, default=_json_default, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(record, indent=2, default=_json_default).encode("utf-8")
+    # JSON strings never contain raw newlines, so splitting on them is safe
+    return b"\n".join(b"  " + line for line in data.split(b"\n"))
+
+
+def _write_stdout_bytes(data: bytes) -> None:
+    """Write bytes to stdout, bypassing the text layer when possible."""
+    stdout_bytes = getattr(sys.stdout, "buffer", None)
+    if stdout_bytes is not None:
+        stdout_bytes.write(data)
+    else:
+        sys.stdout.write(data.decode("utf-8"))
+
+
+def _flush_stdout_bytes() -> None:
+    """Flush the byte stream underlying stdout."""
+    getattr(sys.stdout, "buffer", sys.stdout).flush()
+
+
 def cmd_sync(args: argparse.Namespace, config: FedLedgerConfig) -> int:
     """Execute the sync command.
     
@@ -160,38 +362,45 @@ def cmd_sync(args: argparse.Namespace, config: FedLedgerConfig) -> int:
     Returns:
         Exit code (0 for success, non-zero for failure).
     """
+    from rich.table import Table
+    
+    from fedledger.pipeline import Pipeline
+    from fedledger.pydantic_models import DocumentType
+    
     logger = get_logger(__name__)
+    console = _get_console()
     
     # Map type to DocumentType enum
-    doc_type_map = {
-        "statements": DocumentType.STATEMENT,
-        "minutes": DocumentType.MINUTES,
-        "speeches": DocumentType.SPEECH,
-        "press_conferences": DocumentType.PRESS_CONFERENCE,
-    }
-    
-    doc_type = doc_type_map.get(args.type, DocumentType.STATEMENT)
-    
-    # Display configuration
-    console.print(Panel.fit(
-        f"[bold cyan]Fed Policy Ledger - Document Processing[/bold cyan]\n\n"
-        f"[yellow]Source:[/yellow] {args.source}\n"
-        f"[yellow]Document Type:[/yellow] {args.type}\n"
-        f"[yellow]Parallel:[/yellow] {args.parallel}\n"
-        f"[yellow]Save Raw:[/yellow] {config.save_raw}\n"
-        f"[yellow]Output:[/yellow] {config.processed_dir}",
-        title="Configuration"
-    ))
+    doc_type = DocumentType(_DOC_TYPE_MAP.get(args.type, DocumentType.STATEMENT.value))
+    
+    # Display configuration (a plain line when output is piped or redirected)
+    if console.is_terminal:
+        from rich.panel import Panel
+        
+        console.print(Panel.fit(
+            f"[bold cyan]Fed Policy Ledger - Document Processing[/bold cyan]\n\n"
+            f"[yellow]Source:[/yellow] {args.source}\n"
+            f"[yellow]Document Type:[/yellow] {args.type}\n"
+            f"[yellow]Parallel:[/yellow] {args.parallel}\n"
+            f"[yellow]Save Raw:[/yellow] {config.save_raw}\n"
+            f"[yellow]Output:[/yellow] {config.processed_dir}",
+            title="Configuration"
+        ))
+    else:
+        print(
+            f"[sync] source={args.source} type={args.type} parallel={args.parallel} "
+            f"save_raw={config.save_raw} output={config.processed_dir}"
+        )
     
     if args.dry_run:
         console.print("[yellow]DRY RUN MODE - No files will be modified[/yellow]\n")
         
         # Just show what would be discovered
         pipeline = Pipeline(config)
-        files = pipeline.discover_local_files(args.source, "*.html")
-        
-        if args.limit:
-            files = files[:args.limit]
+        files = list(islice(
+            pipeline.discover_local_files_iter(args.source, "*.html"),
+            args.limit or None,
+        ))
         
         table = Table(title="Documents to Process", show_header=True)
         table.add_column("File", style="cyan")
@@ -208,29 +417,42 @@ def cmd_sync(args: argparse.Namespace, config: FedLedgerConfig) -> int:
     # Create pipeline
     pipeline = Pipeline(config)
     
-    # Run pipeline with progress bar
+    run_kwargs = dict(
+        source_directory=args.source,
+        doc_type=doc_type,
+        pattern="*.html",
+        limit=args.limit,
+    )
+    
+    # Run pipeline with progress bar (terminal only)
     try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=console,
-        ) as progress:
-            
-            task = progress.add_task(
-                f"[cyan]Processing {args.type}...",
-                total=None
-            )
-            
-            result = pipeline.run(
-                source_directory=args.source,
-                doc_type=doc_type,
-                pattern="*.html",
-                limit=args.limit,
+        if console.is_terminal:
+            from rich.progress import (
+                BarColumn,
+                Progress,
+                SpinnerColumn,
+                TaskProgressColumn,
+                TextColumn,
             )
             
-            progress.update(task, completed=True)
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TaskProgressColumn(),
+                console=console,
+            ) as progress:
+                
+                task = progress.add_task(
+                    f"[cyan]Processing {args.type}...",
+                    total=None
+                )
+                
+                result = pipeline.run(**run_kwargs)
+                
+                progress.update(task, completed=True)
+        else:
+            result = pipeline.run(**run_kwargs)
         
         # Display results
         if result.success:
@@ -261,6 +483,60 @@ def cmd_sync(args: argparse.Namespace, config: FedLedgerConfig) -> int:
         return 1
 
 
+def _read_list_preview(parquet_file: Path) -> Tuple[List[str], List[tuple], int]:
+    """Read the rows shown by ``list --format table`` from one Parquet file.
+    
+    Only the first batch of the displayed columns is decoded; the total row
+    count comes from the footer.
+    
+    Args:
+        parquet_file: Parquet file to preview.
+    
+    Returns:
+        Tuple of (displayed columns, preview rows, total row count).
+    """
+    import pyarrow.parquet as pq
+    
+    parquet = pq.ParquetFile(parquet_file)
+    columns = [col for col in LIST_TABLE_COLUMNS if col in parquet.schema_arrow.names]
+    
+    rows: List[tuple] = []
+    for batch in parquet.iter_batches(batch_size=LIST_TABLE_ROWS, columns=columns):
+        # Column-wise conversion, then zip into plain tuples (no per-row dicts)
+        rows = list(zip(*(column.to_pylist() for column in batch.columns)))
+        break
+    
+    return columns, rows, parquet.metadata.num_rows
+
+
+def _map_parquet_reads(
+    read: Callable[[Path], Any],
+    parquet_files: List[Path],
+    config: FedLedgerConfig,
+) -> Iterable[Any]:
+    """Apply a read function to each Parquet file, preserving order.
+    
+    With ``config.parallel`` set, files are read on a thread pool (PyArrow
+    releases the GIL while decompressing). Otherwise files are read lazily
+    one at a time.
+    
+    Args:
+        read: Function reading a single file.
+        parquet_files: Files to read.
+        config: Configuration object.
+    
+    Returns:
+        Read results in the same order as parquet_files.
+    """
+    if not config.parallel or len(parquet_files) < 2:
+        return map(read, parquet_files)
+    
+    from concurrent.futures import ThreadPoolExecutor
+    
+    with ThreadPoolExecutor(max_workers=config.max_workers) as executor:
+        return list(executor.map(read, parquet_files))
+
+
 def cmd_list(args: argparse.Namespace, config: FedLedgerConfig) -> int:
     """Execute the list command.
     
@@ -272,9 +548,14 @@ def cmd_list(args: argparse.Namespace, config: FedLedgerConfig) -> int:
         Exit code (0 for success, non-zero for failure).
     """
     import pyarrow.parquet as pq
+    from rich.table import Table
+    
+    console = _get_console()
     
     # Find parquet files
-    parquet_files = list(config.processed_dir.glob("*.parquet"))
+    parquet_files = [
+        Path(entry.path) for entry in scan_parquet_files(config.processed_dir)
+    ]
     
     if not parquet_files:
         console.print("[yellow]No processed documents found[/yellow]")
@@ -285,43 +566,55 @@ def cmd_list(args: argparse.Namespace, config: FedLedgerConfig) -> int:
         parquet_files = [f for f in parquet_files if args.type in f.name]
     
     if args.format == "table":
-        for parquet_file in parquet_files:
-            table_data = pq.read_table(parquet_file)
-            df = table_data.to_pandas()
-            
+        previews = _map_parquet_reads(_read_list_preview, parquet_files, config)
+        for parquet_file, (columns, rows, total) in zip(parquet_files, previews):
             # Create rich table
             table = Table(title=f"Documents from {parquet_file.name}", show_header=True)
             
             # Add columns
-            for col in ["doc_id", "title", "published_date", "doc_type"]:
-                if col in df.columns:
-                    table.add_column(col, style="cyan" if col == "doc_id" else None)
+            for col in columns:
+                table.add_column(col, style="cyan" if col == "doc_id" else None)
             
             # Add rows (limit to 20 for display)
-            for _, row in df.head(20).iterrows():
-                values = []
-                for col in ["doc_id", "title", "published_date", "doc_type"]:
-                    if col in df.columns:
-                        val = row[col]
-                        if col == "title" and val and len(str(val)) > 50:
-                            val = str(val)[:47] + "..."
-                        values.append(str(val) if val is not None else "")
+            title_idx = columns.index("title") if "title" in columns else -1
+            for row in rows:
+                values = ["" if val is None else str(val) for val in row]
+                if title_idx >= 0 and len(values[title_idx]) > 50:
+                    values[title_idx] = values[title_idx][:47] + "..."
                 table.add_row(*values)
             
             console.print(table)
-            console.print(f"[dim]Showing 20 of {len(df)} documents[/dim]\n")
+            console.print(f"[dim]Showing {len(rows)} of {total} documents[/dim]\n")
     
     elif args.format == "json":
+        # Stream each file as a JSON array, one record batch at a time
+        sys.stdout.flush()
         for parquet_file in parquet_files:
-            table_data = pq.read_table(parquet_file)
-            df = table_data.to_pandas()
-            print(df.to_json(orient="records", indent=2, date_format="iso"))
+            batches = pq.ParquetFile(parquet_file).iter_batches(batch_size=1024)
+            _write_stdout_bytes(b"[")
+            separator = b"\n"
+            for batch in batches:
+                for record in batch.to_pylist():
+                    _write_stdout_bytes(separator + _dump_json_record(record))
+                    separator = b",\n"
+            _write_stdout_bytes(b"]\n" if separator == b"\n" else b"\n]\n")
+        _flush_stdout_bytes()
     
     elif args.format == "csv":
-        for parquet_file in parquet_files:
-            table_data = pq.read_table(parquet_file)
-            df = table_data.to_pandas()
-            print(df.to_csv(index=False))
+        import pyarrow.csv as pacsv
+        
+        for table_data in _map_parquet_reads(pq.read_table, parquet_files, config):
+            sys.stdout.flush()
+            stdout_bytes = getattr(sys.stdout, "buffer", None)
+            if stdout_bytes is not None:
+                pacsv.write_csv(table_data, stdout_bytes)
+                stdout_bytes.flush()
+            else:
+                import pyarrow as pa
+                
+                sink = pa.BufferOutputStream()
+                pacsv.write_csv(table_data, sink)
+                sys.stdout.write(sink.getvalue().to_pybytes().decode("utf-8"))
     
     return 0
 
@@ -336,28 +629,27 @@ def cmd_info(args: argparse.Namespace, config: FedLedgerConfig) -> int:
     Returns:
         Exit code (0 for success, non-zero for failure).
     """
-    # Search for document in metadata files
-    metadata_files = list(config.metadata_dir.glob("*_metadata.json"))
-    
-    for metadata_file in metadata_files:
-        with open(metadata_file, "r") as f:
-            docs = json.load(f)
-        
-        for doc in docs:
-            if doc.get("doc_id") == args.doc_id:
-                # Display document info
-                console.print(Panel.fit(
-                    f"[bold cyan]Document Information[/bold cyan]\n\n"
-                    f"[yellow]ID:[/yellow] {doc.get('doc_id')}\n"
-                    f"[yellow]Type:[/yellow] {doc.get('doc_type')}\n"
-                    f"[yellow]Title:[/yellow] {doc.get('title', 'N/A')}\n"
-                    f"[yellow]Source URL:[/yellow] {doc.get('source_url')}\n"
-                    f"[yellow]Published:[/yellow] {doc.get('published_date', 'N/A')}\n"
-                    f"[yellow]Fetched:[/yellow] {doc.get('fetch_timestamp')}\n"
-                    f"[yellow]Raw Path:[/yellow] {doc.get('raw_path')}",
-                    title=f"Document {args.doc_id}"
-                ))
-                return 0
+    from rich.panel import Panel
+    
+    console = _get_console()
+    
+    # Look up the document through the persistent doc_id index
+    doc = lookup_document(config.metadata_dir, args.doc_id)
+    
+    if doc is not None:
+        # Display document info
+        console.print(Panel.fit(
+            f"[bold cyan]Document Information[/bold cyan]\n\n"
+            f"[yellow]ID:[/yellow] {doc.get('doc_id')}\n"
+            f"[yellow]Type:[/yellow] {doc.get('doc_type')}\n"
+            f"[yellow]Title:[/yellow] {doc.get('title', 'N/A')}\n"
+            f"[yellow]Source URL:[/yellow] {doc.get('source_url')}\n"
+            f"[yellow]Published:[/yellow] {doc.get('published_date', 'N/A')}\n"
+            f"[yellow]Fetched:[/yellow] {doc.get('fetch_timestamp')}\n"
+            f"[yellow]Raw Path:[/yellow] {doc.get('raw_path')}",
+            title=f"Document {args.doc_id}"
+        ))
+        return 0
     
     console.print(f"[red]Document not found:[/red] {args.doc_id}")
     return 1
@@ -373,12 +665,14 @@ def cmd_stats(args: argparse.Namespace, config: FedLedgerConfig) -> int:
     Returns:
         Exit code (0 for success, non-zero for failure).
     """
-    import pyarrow.parquet as pq
+    from rich.table import Table
     
-    # Gather statistics
-    parquet_files = list(config.processed_dir.glob("*.parquet"))
+    console = _get_console()
     
-    if not parquet_files:
+    # Gather statistics from the sidecar inventory, refreshing stale entries
+    parquet_stats = collect_parquet_stats(config.processed_dir)
+    
+    if not parquet_stats:
         console.print("[yellow]No processed documents found[/yellow]")
         return 0
     
@@ -390,15 +684,14 @@ def cmd_stats(args: argparse.Namespace, config: FedLedgerConfig) -> int:
     total_docs = 0
     total_size = 0
     
-    for parquet_file in parquet_files:
-        table_data = pq.read_table(parquet_file)
-        count = len(table_data)
-        size = parquet_file.stat().st_size
+    for name, file_stats in parquet_stats.items():
+        count = file_stats["num_rows"]
+        size = file_stats["size"]
         
         total_docs += count
         total_size += size
         
-        doc_type = parquet_file.stem.replace("_documents", "")
+        doc_type = Path(name).stem.replace("_documents", "")
         stats_table.add_row(
             doc_type,
             str(count),
@@ -412,6 +705,36 @@ def cmd_stats(args: argparse.Namespace, config: FedLedgerConfig) -> int:
     return 0
 
 
+@lru_cache(maxsize=None)
+def _get_config(data_dir: Path, log_level: str, log_json: bool) -> FedLedgerConfig:
+    """Build the base configuration once per distinct set of global options.
+    
+    Settings are read from the environment and .env only on the first call;
+    use ``_get_config.cache_clear()`` to pick up environment changes.
+    
+    Args:
+        data_dir: Base data directory.
+        log_level: Logging level.
+        log_json: Whether to output structured JSON logs.
+    
+    Returns:
+        Shared configuration object. Callers must not mutate it.
+    """
+    return FedLedgerConfig(
+        data_dir=data_dir,
+        log_level=log_level,
+        log_json=log_json,
+    )
+
+
+_COMMAND_HANDLERS = {
+    "sync": cmd_sync,
+    "list": cmd_list,
+    "info": cmd_info,
+    "stats": cmd_stats,
+}
+
+
 def main(argv: Optional[list] = None) -> int:
     """Main entry point for the CLI.
     
@@ -421,43 +744,47 @@ def main(argv: Optional[list] = None) -> int:
     Returns:
         Exit code (0 for success, non-zero for failure).
     """
-    parser = setup_argparser()
-    args = parser.parse_args(argv)
+    if argv is None:
+        argv = sys.argv[1:]
     
-    # Show help if no command specified
-    if not args.command:
-        parser.print_help()
+    # Top-level help needs no parser at all
+    if not argv or argv in (["--help"], ["-h"]):
+        sys.stdout.write(_STATIC_HELP)
         return 0
     
+    # Try the lightweight parser first; argparse handles help and errors
+    args = _fast_parse_args(argv)
+    if args is None:
+        parser = setup_argparser()
+        args = parser.parse_args(argv)
+        
+        # Show help if no command specified
+        if not args.command:
+            parser.print_help()
+            return 0
+    
     # Setup logging
     log_level = "DEBUG" if args.verbose else "INFO"
     setup_logging(level=log_level, json_output=args.log_json)
     
     # Create configuration
-    config = FedLedgerConfig(
-        data_dir=args.data_dir,
-        log_level=log_level,
-        log_json=args.log_json,
-    )
+    config = _get_config(args.data_dir, log_level, args.log_json)
     
-    # Update config from sync-specific args
+    # Update config from sync-specific args (on a copy; the base is cached)
     if args.command == "sync":
-        config.save_raw = args.save_raw
-        config.parallel = args.parallel
-        config.max_workers = args.workers
-        config.overwrite = args.overwrite
+        config = config.model_copy(update={
+            "save_raw": args.save_raw,
+            "parallel": args.parallel,
+            "max_workers": args.workers,
+            "overwrite": args.overwrite,
+            "dry_run": args.dry_run,
+        })
     
     config.ensure_directories()
     
     # Dispatch to appropriate command handler
-    command_handlers = {
-        "sync": cmd_sync,
-        "list": cmd_list,
-        "info": cmd_info,
-        "stats": cmd_stats,
-    }
-    
-    handler = command_handlers.get(args.command)
+    console = _get_console()
+    handler = _COMMAND_HANDLERS.get(args.command)
     if not handler:
         console.print(f"[red]Error:[/red] Unknown command '{args.command}'")
         return 1
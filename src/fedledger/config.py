@@ -5,8 +5,8 @@ for managing application settings with environment variable support.
 """
 
 from pathlib import Path
-from typing import Optional
-from pydantic import Field
+from typing import Literal, Optional
+from pydantic import Field, PrivateAttr, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -25,10 +25,16 @@ class FedLedgerConfig(BaseSettings):
         metadata_dir: Directory for JSON metadata files.
         save_raw: Whether to save raw HTML/PDF files.
         overwrite: Whether to overwrite existing files.
+        dry_run: Only report what would be done; write no ledger files.
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR).
         log_json: Whether to output structured JSON logs.
         parallel: Enable parallel processing.
         max_workers: Maximum number of parallel workers.
+        executor_kind: Worker pool for parallel processing ("thread" or
+            "process").
+        parquet_row_group_size: Maximum rows per Parquet row group (None
+            writes each batch as a single row group).
+        parquet_page_size: Target Parquet data page size in bytes.
         cache_dir: Directory for HTTP cache.
         user_agent: User-Agent string for HTTP requests.
     """
@@ -60,6 +66,10 @@ class FedLedgerConfig(BaseSettings):
         default=False,
         description="Overwrite existing files"
     )
+    dry_run: bool = Field(
+        default=False,
+        description="Report what would be done without writing ledger files"
+    )
     
     # Logging settings
     log_level: str = Field(
@@ -80,6 +90,21 @@ class FedLedgerConfig(BaseSettings):
         default=4,
         description="Maximum number of parallel workers"
     )
+    executor_kind: Literal["thread", "process"] = Field(
+        default="thread",
+        description="Worker pool for parallel processing: threads suit I/O-bound "
+                    "work, processes suit CPU-bound extractors"
+    )
+    
+    # Parquet output settings
+    parquet_row_group_size: Optional[int] = Field(
+        default=None,
+        description="Maximum rows per Parquet row group (None = one per write)"
+    )
+    parquet_page_size: int = Field(
+        default=256 * 1024,
+        description="Target Parquet data page size in bytes"
+    )
     
     # HTTP settings
     cache_dir: Optional[Path] = Field(
@@ -91,6 +116,9 @@ class FedLedgerConfig(BaseSettings):
         description="User-Agent string for HTTP requests"
     )
     
+    # Directory set created by the last ensure_directories() call
+    _ensured_dirs: Optional[tuple] = PrivateAttr(default=None)
+    
     model_config = SettingsConfigDict(
         env_prefix="FEDLEDGER_",
         env_file=".env",
@@ -98,28 +126,39 @@ class FedLedgerConfig(BaseSettings):
         case_sensitive=False,
     )
     
-    def __init__(self, **kwargs):
-        """Initialize configuration and set default paths."""
-        super().__init__(**kwargs)
-        
-        # Set default subdirectories if not specified
+    @model_validator(mode="after")
+    def _fill_subdirs(self) -> "FedLedgerConfig":
+        """Set default subdirectories of data_dir if not specified."""
         if self.raw_dir is None:
             self.raw_dir = self.data_dir / "raw"
         if self.processed_dir is None:
             self.processed_dir = self.data_dir / "processed"
         if self.metadata_dir is None:
             self.metadata_dir = self.data_dir / "metadata"
+        return self
     
     def ensure_directories(self):
-        """Create all configured directories if they don't exist."""
-        for dir_path in [
-            self.data_dir,
-            self.raw_dir,
-            self.processed_dir,
-            self.metadata_dir,
-        ]:
-            if dir_path:
-                dir_path.mkdir(parents=True, exist_ok=True)
+        """Create all configured directories if they don't exist.
+        
+        Directories are created shallowest first so each mkdir finds its
+        parent in place. Repeated calls with unchanged paths are no-ops.
+        """
+        dir_paths = tuple(dict.fromkeys(
+            dir_path
+            for dir_path in [
+                self.data_dir,
+                self.raw_dir,
+                self.processed_dir,
+                self.metadata_dir,
+                self.cache_dir,
+            ]
+            if dir_path
+        ))
+        
+        if dir_paths == self._ensured_dirs:
+            return
+        
+        for dir_path in sorted(dir_paths, key=lambda p: len(p.parts)):
+            dir_path.mkdir(parents=True, exist_ok=True)
         
-        if self.cache_dir:
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._ensured_dirs = dir_paths
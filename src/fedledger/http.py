@@ -5,6 +5,13 @@ and proper error handling for retrieving documents from Federal Reserve
 websites.
 """
 
+import json
+import os
+import shutil
+import socket
+import struct
+import tempfile
+import threading
 import time
 from pathlib import Path
 from typing import Optional, Dict, Any
@@ -14,12 +21,77 @@ import hashlib
 try:
     import requests
     from requests.adapters import HTTPAdapter
+    from requests.structures import CaseInsensitiveDict
+    from requests.utils import get_encoding_from_headers
+    from urllib3.connection import HTTPConnection
     from urllib3.util.retry import Retry
 except ImportError:
     requests = None
     HTTPAdapter = None
+    CaseInsensitiveDict = None
+    get_encoding_from_headers = None
+    HTTPConnection = None
     Retry = None
 
+from fedledger.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+# Cache entry layout: this header, then a JSON blob with the URL, reason and
+# response headers, then the raw body bytes
+# (status_code, fetched_at, json_length)
+_CACHE_HEADER = struct.Struct("<IdI")
+
+# requests.get() arguments that do not change the response body; any other
+# argument except params (which is folded into the cache key) bypasses the
+# cache
+_CACHE_NEUTRAL_KWARGS = frozenset({"verify", "cert", "proxies"})
+
+# Retry policy for common transient failures
+_RETRY_STATUS_FORCELIST = (429, 500, 502, 503, 504)
+_RETRY_ALLOWED_METHODS = frozenset({"HEAD", "GET", "OPTIONS"})
+
+# Default HTTPSession settings; sessions built with these share one adapter,
+# and with it one keep-alive connection pool
+_DEFAULT_MAX_RETRIES = 3
+_DEFAULT_BACKOFF_FACTOR = 0.3
+_DEFAULT_POOL_CONNECTIONS = 20
+_DEFAULT_POOL_MAXSIZE = 50
+
+if requests is not None:
+    # urllib3's defaults already set TCP_NODELAY; keep them explicit and add
+    # SO_KEEPALIVE so idle pooled connections are not silently dropped
+    _SOCKET_OPTIONS = list(HTTPConnection.default_socket_options)
+    for _option in (
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ):
+        if _option not in _SOCKET_OPTIONS:
+            _SOCKET_OPTIONS.append(_option)
+    
+    class _SocketOptionsAdapter(HTTPAdapter):
+        """HTTPAdapter whose pooled connections disable Nagle and keep alive."""
+        
+        def init_poolmanager(self, *args, **kwargs):
+            kwargs.setdefault("socket_options", _SOCKET_OPTIONS)
+            super().init_poolmanager(*args, **kwargs)
+    
+    _DEFAULT_RETRY = Retry(
+        total=_DEFAULT_MAX_RETRIES,
+        backoff_factor=_DEFAULT_BACKOFF_FACTOR,
+        status_forcelist=_RETRY_STATUS_FORCELIST,
+        allowed_methods=_RETRY_ALLOWED_METHODS
+    )
+    _DEFAULT_ADAPTER = _SocketOptionsAdapter(
+        max_retries=_DEFAULT_RETRY,
+        pool_connections=_DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize=_DEFAULT_POOL_MAXSIZE
+    )
+else:
+    _DEFAULT_RETRY = None
+    _DEFAULT_ADAPTER = None
+
 
 class HTTPSession:
     """HTTP session with retry logic and disk caching.
@@ -30,18 +102,25 @@ class HTTPSession:
     
     Attributes:
         cache_dir: Directory for caching HTTP responses.
+        max_age: Maximum age of cached responses in seconds (None = no expiry).
         session: Underlying requests.Session object.
         timeout: Default timeout for requests in seconds.
         user_agent: User-Agent string for requests.
     """
     
+    _shared: Optional["HTTPSession"] = None
+    _shared_lock = threading.Lock()
+    
     def __init__(
         self,
         cache_dir: Optional[Path] = None,
         timeout: int = 30,
-        max_retries: int = 3,
-        backoff_factor: float = 0.3,
-        user_agent: Optional[str] = None
+        max_retries: int = _DEFAULT_MAX_RETRIES,
+        backoff_factor: float = _DEFAULT_BACKOFF_FACTOR,
+        user_agent: Optional[str] = None,
+        max_age: Optional[float] = None,
+        pool_connections: int = _DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = _DEFAULT_POOL_MAXSIZE
     ):
         """Initialize HTTP session with retry and caching configuration.
         
@@ -51,6 +130,15 @@ class HTTPSession:
             max_retries: Maximum number of retry attempts for failed requests.
             backoff_factor: Backoff factor for retry delays (delay = backoff * (2 ^ retry_count)).
             user_agent: Custom User-Agent string. Defaults to a descriptive agent.
+            max_age: Maximum age of cached responses in seconds. If None, cached
+                     responses never expire.
+            pool_connections: Number of per-host connection pools to cache.
+            pool_maxsize: Maximum connections kept alive per host. Must be at
+                          least the number of threads sharing this session,
+                          or extra connections are discarded after each use.
+        
+        Sessions created with the default retry and pool settings share a
+        module-level adapter, so connections are reused across sessions.
         """
         if requests is None:
             raise ImportError(
@@ -59,6 +147,7 @@ class HTTPSession:
         
         self.cache_dir = Path(cache_dir) if cache_dir else None
         self.timeout = timeout
+        self.max_age = max_age
         self.user_agent = user_agent or "FedPolicyLedger/0.1.0 (Research/Archival)"
         
         # Initialize cache directory if caching is enabled
@@ -68,15 +157,26 @@ class HTTPSession:
         # Configure session with retry strategy
         self.session = requests.Session()
         
-        # Set up retry strategy for common transient failures
-        retry_strategy = Retry(
-            total=max_retries,
-            backoff_factor=backoff_factor,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS"]
-        )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        if (
+            max_retries == _DEFAULT_MAX_RETRIES
+            and backoff_factor == _DEFAULT_BACKOFF_FACTOR
+            and pool_connections == _DEFAULT_POOL_CONNECTIONS
+            and pool_maxsize == _DEFAULT_POOL_MAXSIZE
+        ):
+            adapter = _DEFAULT_ADAPTER
+        else:
+            # Set up retry strategy for common transient failures
+            retry_strategy = Retry(
+                total=max_retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=_RETRY_STATUS_FORCELIST,
+                allowed_methods=_RETRY_ALLOWED_METHODS
+            )
+            adapter = _SocketOptionsAdapter(
+                max_retries=retry_strategy,
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize
+            )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
@@ -86,11 +186,27 @@ class HTTPSession:
             "Accept": "text/html,application/pdf,*/*",
         })
     
+    @classmethod
+    def shared(cls) -> "HTTPSession":
+        """Return a process-wide session with default settings.
+        
+        The shared session has no disk cache. Callers should not close it.
+        
+        Returns:
+            The shared HTTPSession instance.
+        """
+        if cls._shared is None:
+            with cls._shared_lock:
+                if cls._shared is None:
+                    cls._shared = cls()
+        return cls._shared
+    
     def get(
         self,
         url: str,
         use_cache: bool = True,
         timeout: Optional[int] = None,
+        stream: bool = False,
         **kwargs
     ) -> "requests.Response":
         """Fetch a URL with optional disk caching.
@@ -99,7 +215,13 @@ class HTTPSession:
             url: URL to fetch.
             use_cache: Whether to use cached response if available.
             timeout: Request timeout in seconds. Uses session default if None.
+            stream: If True, return before the body is read so the caller
+                    can consume it incrementally. Streamed responses are
+                    not written to the cache.
             **kwargs: Additional arguments passed to requests.get().
+                    Query ``params`` are part of the cache key; other
+                    arguments that can change the response (headers, auth,
+                    cookies, ...) bypass the cache.
         
         Returns:
             Response object from requests.
@@ -107,68 +229,142 @@ class HTTPSession:
         Raises:
             requests.RequestException: If the request fails after retries.
         """
+        cache_key = self._cache_key(url, kwargs) if self.cache_dir else None
+        
         # Check cache first if enabled
-        if use_cache and self.cache_dir:
-            cached_response = self._get_from_cache(url)
+        if use_cache and cache_key is not None:
+            cached_response = self._get_from_cache(cache_key)
             if cached_response:
                 return cached_response
         
         # Perform the request
         timeout = timeout or self.timeout
-        response = self.session.get(url, timeout=timeout, **kwargs)
+        response = self.session.get(url, timeout=timeout, stream=stream, **kwargs)
         response.raise_for_status()
         
-        # Cache the response if caching is enabled
-        if self.cache_dir:
-            self._save_to_cache(url, response)
+        # Cache the response if caching is enabled. Streamed responses are
+        # left unread so large downloads are not buffered in memory.
+        if cache_key is not None and not stream:
+            self._save_to_cache(cache_key, response)
         
         return response
     
+    @staticmethod
+    def _cache_key(url: str, kwargs: Dict[str, Any]) -> Optional[str]:
+        """Return the cache key for a request, or None if it is not cacheable.
+        
+        Args:
+            url: URL passed to get().
+            kwargs: Extra requests.get() arguments passed to get().
+        
+        Returns:
+            The URL with any query params applied, or None if other
+            arguments could change the response.
+        """
+        if not kwargs.keys() - _CACHE_NEUTRAL_KWARGS - {"params"}:
+            params = kwargs.get("params")
+            if not params:
+                return url
+            prepared = requests.PreparedRequest()
+            prepared.prepare_url(url, params)
+            return prepared.url
+        return None
+    
     def _get_cache_path(self, url: str) -> Path:
         """Generate cache file path for a URL.
         
+        Entries are sharded into subdirectories by the first two hex
+        characters of the hash so no single directory grows too large.
+        
         Args:
             url: URL to generate cache path for.
         
         Returns:
             Path object for the cache file.
         """
-        # Use URL hash as filename to avoid filesystem issues
-        url_hash = hashlib.sha256(url.encode("utf-8")).hexdigest()
-        return self.cache_dir / f"{url_hash}.cache"
+        # Use URL hash as filename to avoid filesystem issues. The key needs
+        # no cryptographic strength, so a 16-byte BLAKE2b digest is enough.
+        url_hash = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+        return self.cache_dir / url_hash[:2] / f"{url_hash}.cache"
     
-    def _get_from_cache(self, url: str) -> Optional[Any]:
+    def _get_from_cache(self, url: str) -> Optional["requests.Response"]:
         """Retrieve cached response for a URL.
         
         Args:
             url: URL to check cache for.
         
         Returns:
-            Cached response if available, None otherwise.
+            Cached response if available and not older than max_age, None
+            otherwise.
         """
         cache_path = self._get_cache_path(url)
         
-        if not cache_path.exists():
+        try:
+            data = cache_path.read_bytes()
+            status_code, fetched_at, meta_length = _CACHE_HEADER.unpack_from(data)
+            meta_end = _CACHE_HEADER.size + meta_length
+            meta = json.loads(data[_CACHE_HEADER.size:meta_end])
+        except (OSError, ValueError, struct.error):
+            # Missing, truncated or corrupt entries are treated as misses
             return None
         
-        # For now, we don't implement full response caching
-        # This is a placeholder for future implementation
-        return None
+        if self.max_age is not None and time.time() - fetched_at > self.max_age:
+            return None
+        
+        response = requests.Response()
+        response.status_code = status_code
+        response.reason = meta.get("reason")
+        response.headers = CaseInsensitiveDict(meta.get("headers", {}))
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = meta.get("url", url)
+        response._content = data[meta_end:]
+        return response
     
     def _save_to_cache(self, url: str, response: "requests.Response") -> None:
         """Save response to disk cache.
         
+        Failures to write the entry (e.g. a full or read-only cache
+        directory) are logged and otherwise ignored; the response itself
+        was fetched successfully.
+        
         Args:
             url: URL of the response.
             response: Response object to cache.
         """
-        # Placeholder for cache implementation
-        # In a full implementation, this would serialize the response
-        pass
+        cache_path = self._get_cache_path(url)
+        meta = json.dumps({
+            "url": response.url or url,
+            "reason": response.reason,
+            "headers": dict(response.headers),
+        }).encode("utf-8")
+        header = _CACHE_HEADER.pack(response.status_code, time.time(), len(meta))
+        
+        # Write to a uniquely named temporary file and rename so readers
+        # never see a partially written entry, even when several threads
+        # cache the same URL at once
+        tmp_path = None
+        try:
+            cache_path.parent.mkdir(exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=f".{cache_path.name}.", suffix=".tmp", dir=cache_path.parent
+            )
+            with open(fd, "wb") as f:
+                f.write(header)
+                f.write(meta)
+                f.write(response.content)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to cache {url}: {e}")
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
     
     def close(self):
         """Close the HTTP session and release resources."""
         if self.session:
+            # Keep the shared adapter's pool alive for other sessions
+            for prefix, adapter in list(self.session.adapters.items()):
+                if adapter is _DEFAULT_ADAPTER:
+                    del self.session.adapters[prefix]
             self.session.close()
     
     def __enter__(self):
@@ -180,11 +376,36 @@ class HTTPSession:
         self.close()
 
 
+# Archival downloads are written once and not read back soon
+_DOWNLOAD_OPEN_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+)
+
+
+def _drop_page_cache(fd: int) -> None:
+    """Advise the kernel that a written file's pages will not be reused.
+    
+    This keeps bulk downloads from evicting more useful pages from the page
+    cache. It is a best-effort hint: pages that are still dirty are only
+    dropped once written back. Platforms without posix_fadvise (Windows,
+    macOS) skip it.
+    
+    Args:
+        fd: File descriptor of the written file.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass
+
+
 def download_to_file(
     url: str,
     output_path: Path,
     session: Optional[HTTPSession] = None,
-    chunk_size: int = 8192
+    chunk_size: int = 65536
 ) -> Dict[str, Any]:
     """Download a URL to a file with streaming support.
     
@@ -192,7 +413,8 @@ def download_to_file(
         url: URL to download.
         output_path: Path where the file should be saved.
         session: Optional HTTPSession to use. Creates a new one if None.
-        chunk_size: Size of chunks for streaming download.
+        chunk_size: Copy buffer size in bytes. The 64 KB default matches
+                    typical TCP and TLS record sizes.
     
     Returns:
         Dictionary with download metadata including status_code, content_type,
@@ -207,18 +429,26 @@ def download_to_file(
         own_session = True
     
     try:
+        # Stream so memory use stays at one chunk regardless of file size
         response = session.get(url, stream=True)
+        response.raise_for_status()
         
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Stream download to file
-        total_size = 0
-        with open(output_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=chunk_size):
-                if chunk:
-                    f.write(chunk)
-                    total_size += len(chunk)
+        # Copy the raw stream to disk in C; decode_content makes urllib3
+        # undo any gzip/deflate transfer encoding as iter_content() would
+        fd = os.open(output_path, _DOWNLOAD_OPEN_FLAGS, 0o644)
+        with os.fdopen(fd, "wb") as f:
+            if response.raw is not None:
+                response.raw.decode_content = True
+                shutil.copyfileobj(response.raw, f, chunk_size)
+            else:
+                # Cached responses carry their body in memory
+                f.write(response.content)
+            total_size = f.tell()
+            f.flush()
+            _drop_page_cache(f.fileno())
         
         return {
             "status_code": response.status_code,
@@ -1,39 +1,144 @@
 """Document ID generation utilities.
 
 This module provides helpers for generating stable document identifiers
-based on source URLs using SHA-1 hashing.
+based on source URLs using BLAKE2b hashing (or truncated SHA-1 for legacy
+stores).
 """
 
 import hashlib
-from typing import Optional
+import os
+from functools import lru_cache
+from typing import Iterable, List, Optional
 
 
-def generate_doc_id(source_url: str) -> str:
+# Environment variable selecting the doc_id hash scheme
+HASH_SCHEME_ENV = "FEDLEDGER_HASH_SCHEME"
+
+# Supported schemes: "blake2b" (default for new ledgers) and "sha1", the
+# original sha1(source_url)[:16] scheme kept for reading legacy stores
+HASH_SCHEMES = ("blake2b", "sha1")
+
+HASH_SCHEME = os.environ.get(HASH_SCHEME_ENV, "blake2b").lower()
+
+# File in a ledger's data directory recording the scheme its doc_ids use,
+# so an existing ledger keeps its scheme whatever the default is
+HASH_SCHEME_FILE = ".doc_id_scheme"
+
+# Both schemes produce lowercase hex digests; bytes.translate() deletes
+# these in one C-level pass, leaving only invalid characters
+_DOC_ID_LENGTH = 16
+_HEX_DIGITS = b"0123456789abcdef"
+
+
+@lru_cache(maxsize=8192)
+def generate_doc_id(source_url: str, scheme: Optional[str] = None) -> str:
     """Generate a stable document ID from a source URL.
     
-    Creates a 16-character hexadecimal ID by computing the SHA-1 hash
-    of the source URL and taking the first 16 characters. This ensures
-    stable, unique identifiers for documents regardless of when they
-    are fetched.
+    Creates a 16-character hexadecimal ID from the source URL. The default
+    scheme is an 8-byte BLAKE2b digest, which yields exactly 16 hex
+    characters with nothing discarded. The legacy scheme takes the first 16
+    characters of the SHA-1 hex digest. Either way the ID is stable for a
+    URL regardless of when the document is fetched.
+    
+    Results are memoized, since the same URL is typically hashed several
+    times per document (fetch, cache path, log context, model construction).
     
     Args:
         source_url: The source URL of the document to generate an ID for.
+        scheme: Hash scheme ("blake2b" or "sha1"). Defaults to HASH_SCHEME,
+                set from the FEDLEDGER_HASH_SCHEME environment variable.
     
     Returns:
         A 16-character hexadecimal string serving as the document ID.
     
+    Raises:
+        ValueError: If source_url is empty or the scheme is unknown.
+    
     Examples:
         >>> generate_doc_id("https://www.federalreserve.gov/statement.htm")
-        '8a3f9c2e1b4d7a6c'
+        '1382332057c12eca'
+        >>> generate_doc_id(
+        ...     "https://www.federalreserve.gov/statement.htm", scheme="sha1"
+        ... )
+        'dc11288aa80a47e9'
     """
     if not source_url:
         raise ValueError("source_url cannot be empty")
     
-    # Compute SHA-1 hash of the URL
-    hash_obj = hashlib.sha1(source_url.encode("utf-8"))
+    scheme = scheme or HASH_SCHEME
+    
+    if scheme == "blake2b":
+        return hashlib.blake2b(source_url.encode("utf-8"), digest_size=8).hexdigest()
     
-    # Return first 16 characters of hex digest
-    return hash_obj.hexdigest()[:16]
+    if scheme == "sha1":
+        # Legacy: first 16 characters of the SHA-1 hex digest
+        return hashlib.sha1(source_url.encode("utf-8")).hexdigest()[:16]
+    
+    raise ValueError(
+        f"Unknown doc_id hash scheme: {scheme}. "
+        f"Must be one of: {', '.join(HASH_SCHEMES)}"
+    )
+
+
+def generate_doc_ids(
+    source_urls: Iterable[str],
+    scheme: Optional[str] = None,
+) -> List[str]:
+    """Generate document IDs for a batch of source URLs.
+    
+    Equivalent to calling generate_doc_id() for each URL, but with the hash
+    constructor bound once outside the loop and without going through the
+    per-URL memoization, which only pays off for repeated URLs.
+    
+    Args:
+        source_urls: Source URLs to generate IDs for.
+        scheme: Hash scheme ("blake2b" or "sha1"). Defaults to HASH_SCHEME.
+    
+    Returns:
+        Document IDs in the same order as source_urls.
+    
+    Raises:
+        ValueError: If any URL is empty or the scheme is unknown.
+    
+    Examples:
+        >>> generate_doc_ids(["https://www.federalreserve.gov/statement.htm"])
+        ['1382332057c12eca']
+    """
+    scheme = scheme or HASH_SCHEME
+    if scheme != "blake2b":
+        return [generate_doc_id(url, scheme) for url in source_urls]
+    
+    blake2b = hashlib.blake2b
+    doc_ids = []
+    append = doc_ids.append
+    for url in source_urls:
+        if not url:
+            raise ValueError("source_url cannot be empty")
+        append(blake2b(url.encode("utf-8"), digest_size=8).hexdigest())
+    
+    return doc_ids
+
+
+def detect_hash_scheme(source_url: str, doc_id: str) -> Optional[str]:
+    """Find the hash scheme that produced a stored doc_id.
+    
+    Args:
+        source_url: Source URL of a stored document.
+        doc_id: The doc_id stored for it.
+    
+    Returns:
+        The matching scheme, or None if no scheme reproduces doc_id.
+    
+    Examples:
+        >>> detect_hash_scheme(
+        ...     "https://www.federalreserve.gov/statement.htm", "dc11288aa80a47e9"
+        ... )
+        'sha1'
+    """
+    for scheme in HASH_SCHEMES:
+        if generate_doc_id(source_url, scheme) == doc_id:
+            return scheme
+    return None
 
 
 def validate_doc_id(doc_id: str) -> bool:
@@ -43,7 +148,8 @@ def validate_doc_id(doc_id: str) -> bool:
         doc_id: The document ID to validate.
     
     Returns:
-        True if the doc_id is valid (16 hexadecimal characters), False otherwise.
+        True if the doc_id is valid (16 lowercase hexadecimal characters),
+        False otherwise.
     
     Examples:
         >>> validate_doc_id("8a3f9c2e1b4d7a6c")
@@ -51,14 +157,12 @@ def validate_doc_id(doc_id: str) -> bool:
         >>> validate_doc_id("invalid")
         False
     """
-    if not doc_id or len(doc_id) != 16:
-        return False
-    
-    try:
-        int(doc_id, 16)
-        return True
-    except ValueError:
-        return False
+    return (
+        bool(doc_id)
+        and len(doc_id) == _DOC_ID_LENGTH
+        and doc_id.isascii()
+        and not doc_id.encode("ascii").translate(None, _HEX_DIGITS)
+    )
 
 
 def doc_id_from_url(url: str, prefix: Optional[str] = None) -> str:
@@ -82,13 +186,9 @@ def doc_id_from_url(url: str, prefix: Optional[str] = None) -> str:
     
     Examples:
         >>> doc_id_from_url("https://example.com/doc")
-        '8a3f9c2e1b4d7a6c'
+        'ca7ef89631ebeec6'
         >>> doc_id_from_url("https://example.com/doc", prefix="fomc_")
-        'fomc_8a3f9c2e1b4d7a6c'  # Note: This is 21 chars, prefix is for categorization
+        'fomc_ca7ef89631ebeec6'  # Note: This is 21 chars, prefix is for categorization
     """
     doc_id = generate_doc_id(url)
-    
-    if prefix:
-        return f"{prefix}{doc_id}"
-    
-    return doc_id
+    return prefix + doc_id if prefix else doc_id
@@ -7,11 +7,67 @@ formatting for tracking document processing pipelines.
 import logging
 import json
 import sys
-import traceback
-from datetime import datetime
+import time
 from typing import Optional, Dict, Any
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Record attribute under which LoggerAdapter attaches its context dict
+_CONTEXT_KEY = "_fedctx"
+
+# LogRecord attributes that are not user-supplied extra fields
+_STD_RECORD_FIELDS = frozenset({
+    "name", "msg", "args", "created", "filename", "funcName",
+    "levelname", "levelno", "lineno", "module", "msecs",
+    "message", "pathname", "process", "processName", "relativeCreated",
+    "thread", "threadName", "exc_info", "exc_text", "stack_info",
+    "taskName", _CONTEXT_KEY,
+})
+
+# Context fields appended to human-readable console messages
+_CTX_KEYS = ("doc_id", "extractor")
+
+
+# orjson encodes several times faster than the stdlib encoder; its output is
+# compact (no spaces after separators) but otherwise equivalent
+if orjson is not None:
+    def _dumps(obj: Dict[str, Any]) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+else:
+    _dumps = json.dumps
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last formatted timestamp;
+# kept as one tuple so concurrent handlers never see a torn update
+_last_timestamp = (None, "")
+
+
+def _format_timestamp(created: float) -> str:
+    """Format an epoch timestamp as ISO 8601 UTC with microseconds.
+    
+    The date and time-of-day part is cached per second, so records logged
+    within the same second only format the fractional part.
+    
+    Args:
+        created: Seconds since the epoch (LogRecord.created).
+    
+    Returns:
+        Timestamp string such as "2024-01-31T14:00:00.123456Z".
+    """
+    global _last_timestamp
+    
+    sec = int(created)
+    cached_sec, prefix = _last_timestamp
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _last_timestamp = (sec, prefix)
+    
+    return f"{prefix}.{int((created - sec) * 1e6):06d}Z"
+
 
 class StructuredFormatter(logging.Formatter):
     """Custom formatter that outputs structured JSON logs.
@@ -34,43 +90,36 @@ class StructuredFormatter(logging.Formatter):
         Returns:
             JSON string representation of the log record.
         """
+        attrs = record.__dict__
+        
+        # Build the record in one literal: extra fields passed to the logger,
+        # then LoggerAdapter context (which takes precedence). None values
+        # are omitted.
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": _format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
+            **{
+                key: value
+                for key, value in attrs.items()
+                if key not in _STD_RECORD_FIELDS and value is not None
+            },
+            **(attrs.get(_CONTEXT_KEY) or {}),
         }
         
-        # Add context fields if present
-        if hasattr(record, "doc_id"):
-            log_data["doc_id"] = record.doc_id
-        if hasattr(record, "extractor"):
-            log_data["extractor"] = record.extractor
-        if hasattr(record, "source_url"):
-            log_data["source_url"] = record.source_url
-        if hasattr(record, "doc_type"):
-            log_data["doc_type"] = record.doc_type
-        
-        # Add exception information if present
+        # Add exception information if present. The traceback is rendered
+        # once into record.exc_text, which logging reuses across handlers.
         if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
             log_data["exception"] = {
                 "type": record.exc_info[0].__name__,
                 "message": str(record.exc_info[1]),
-                "traceback": traceback.format_exception(*record.exc_info),
+                "traceback": record.exc_text,
             }
         
-        # Add any extra fields passed to the logger
-        for key, value in record.__dict__.items():
-            if key not in [
-                "name", "msg", "args", "created", "filename", "funcName",
-                "levelname", "levelno", "lineno", "module", "msecs",
-                "message", "pathname", "process", "processName", "relativeCreated",
-                "thread", "threadName", "exc_info", "exc_text", "stack_info",
-                "doc_id", "extractor", "source_url", "doc_type"
-            ]:
-                log_data[key] = value
-        
-        return json.dumps(log_data)
+        return _dumps(log_data)
 
 
 class ColoredFormatter(logging.Formatter):
@@ -94,15 +143,21 @@ class ColoredFormatter(logging.Formatter):
         Returns:
             Colored string representation of the log record.
         """
+        # Format a copy so other handlers (e.g. the JSON file handler) never
+        # see ANSI escapes or the appended context
+        record = logging.makeLogRecord(record.__dict__)
         color = self.COLORS.get(record.levelname, self.RESET)
         record.levelname = f"{color}{record.levelname}{self.RESET}"
         
-        # Add context to message if present
-        context_parts = []
-        if hasattr(record, "doc_id"):
-            context_parts.append(f"doc_id={record.doc_id}")
-        if hasattr(record, "extractor"):
-            context_parts.append(f"extractor={record.extractor}")
+        # Add context to message if present, from LoggerAdapter context or
+        # fields passed directly via extra=
+        attrs = record.__dict__
+        context = attrs.get(_CONTEXT_KEY) or {}
+        context_parts = [
+            f"{key}={value}"
+            for key in _CTX_KEYS
+            if (value := context.get(key, attrs.get(key))) is not None
+        ]
         
         if context_parts:
             record.msg = f"{record.msg} [{', '.join(context_parts)}]"
@@ -174,9 +229,13 @@ class LoggerAdapter(logging.LoggerAdapter):
         Returns:
             Tuple of (message, kwargs) with context added.
         """
-        # Add context fields as extra attributes
-        extra = kwargs.get("extra", {})
-        extra.update(self.extra)
+        # Attach context as a single dict so formatters merge it in one step
+        # rather than probing for each field
+        extra = kwargs.get("extra")
+        extra = dict(extra) if extra else {}
+        extra[_CONTEXT_KEY] = {
+            key: value for key, value in self.extra.items() if value is not None
+        }
         kwargs["extra"] = extra
         return msg, kwargs
 
@@ -0,0 +1,249 @@
+"""Persistent doc_id index over JSON metadata files.
+
+This module maintains a small SQLite index in the metadata directory that
+maps each doc_id to the byte range of its record inside a
+``*_metadata.json`` file, so single-document lookups read and decode one
+record instead of every metadata file.
+"""
+
+import json
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from fedledger.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+INDEX_FILENAME = ".index.sqlite"
+METADATA_SUFFIX = "_metadata.json"
+
+# orjson decodes bytes directly and is several times faster; json.loads
+# also accepts bytes, so either can be fed a raw file read
+_loads = orjson.loads if orjson is not None else json.loads
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    metadata_file TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS documents (
+    doc_id TEXT PRIMARY KEY,
+    metadata_file TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL
+);
+"""
+
+
+def _scan_metadata_files(metadata_dir: Path) -> Dict[str, Tuple[int, int]]:
+    """List metadata files with their (mtime_ns, size) signatures.
+    
+    Args:
+        metadata_dir: Directory containing metadata JSON files.
+    
+    Returns:
+        Mapping of file name to (mtime_ns, size).
+    """
+    files = {}
+    with os.scandir(metadata_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(METADATA_SUFFIX) and entry.is_file():
+                stat = entry.stat()
+                files[entry.name] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+
+def _iter_record_spans(data: bytes) -> Iterator[Tuple[str, int, int]]:
+    """Yield (doc_id, byte_offset, byte_length) for each record in a JSON array.
+    
+    Args:
+        data: Raw bytes of a metadata file (a JSON list of objects).
+    
+    Yields:
+        Tuples locating each record that carries a doc_id.
+    
+    Raises:
+        ValueError: If the data is not a JSON array of records.
+    """
+    text = data.decode("utf-8")
+    ascii_only = len(text) == len(data)
+    decoder = json.JSONDecoder()
+    
+    pos = len(text) - len(text.lstrip())
+    if not text.startswith("[", pos):
+        raise ValueError("metadata file is not a JSON array")
+    pos += 1
+    char_pos = byte_pos = 0
+    while True:
+        while pos < len(text) and text[pos] in " \t\r\n,":
+            pos += 1
+        if pos >= len(text) or text[pos] == "]":
+            return
+        
+        record, end = decoder.raw_decode(text, pos)
+        if ascii_only:
+            start_byte, end_byte = pos, end
+        else:
+            byte_pos += len(text[char_pos:pos].encode("utf-8"))
+            start_byte = byte_pos
+            byte_pos += len(text[pos:end].encode("utf-8"))
+            end_byte = byte_pos
+            char_pos = end
+        
+        if isinstance(record, dict) and record.get("doc_id"):
+            yield record["doc_id"], start_byte, end_byte - start_byte
+        pos = end
+
+
+def _refresh(
+    conn: sqlite3.Connection,
+    metadata_dir: Path,
+    current: Dict[str, Tuple[int, int]],
+) -> None:
+    """Re-index metadata files whose signature changed since the last build.
+    
+    Args:
+        conn: Open index connection.
+        metadata_dir: Directory containing metadata JSON files.
+        current: Current file signatures from _scan_metadata_files().
+    """
+    indexed = {
+        name: (mtime_ns, size)
+        for name, mtime_ns, size in conn.execute(
+            "SELECT metadata_file, mtime_ns, size FROM files"
+        )
+    }
+    if indexed == current:
+        return
+    
+    with conn:
+        for name in indexed.keys() - current.keys():
+            conn.execute("DELETE FROM documents WHERE metadata_file = ?", (name,))
+            conn.execute("DELETE FROM files WHERE metadata_file = ?", (name,))
+        
+        for name, signature in current.items():
+            if indexed.get(name) == signature:
+                continue
+            conn.execute("DELETE FROM documents WHERE metadata_file = ?", (name,))
+            try:
+                spans = list(_iter_record_spans((metadata_dir / name).read_bytes()))
+            except (OSError, ValueError) as e:
+                # Index nothing from an unreadable file; its signature is
+                # still recorded so it is retried only once it changes
+                logger.warning(f"Skipping unreadable metadata file {name}: {e}")
+                spans = []
+            conn.executemany(
+                "INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?)",
+                ((doc_id, name, offset, length) for doc_id, offset, length in spans),
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?)",
+                (name, signature[0], signature[1]),
+            )
+
+
+def build_index(metadata_dir: Path) -> Path:
+    """Create or update the doc_id index for a metadata directory.
+    
+    Only files whose mtime or size changed since the last build are
+    re-read.
+    
+    Args:
+        metadata_dir: Directory containing metadata JSON files.
+    
+    Returns:
+        Path to the index database.
+    """
+    metadata_dir = Path(metadata_dir)
+    index_path = metadata_dir / INDEX_FILENAME
+    
+    conn = sqlite3.connect(index_path)
+    try:
+        conn.executescript(_SCHEMA)
+        _refresh(conn, metadata_dir, _scan_metadata_files(metadata_dir))
+    finally:
+        conn.close()
+    
+    return index_path
+
+
+def _scan_for_document(metadata_dir: Path, doc_id: str) -> Optional[Dict[str, Any]]:
+    """Find a document by decoding every metadata file (no index).
+    
+    Files that cannot be read or are not JSON lists are skipped.
+    """
+    for metadata_file in metadata_dir.glob(f"*{METADATA_SUFFIX}"):
+        try:
+            with open(metadata_file, "rb") as f:
+                docs = _loads(f.read())
+        except (OSError, ValueError):
+            continue
+        if not isinstance(docs, list):
+            continue
+        
+        doc = next(
+            (d for d in docs if isinstance(d, dict) and d.get("doc_id") == doc_id),
+            None,
+        )
+        if doc is not None:
+            return doc
+    
+    return None
+
+
+def lookup_document(metadata_dir: Path, doc_id: str) -> Optional[Dict[str, Any]]:
+    """Look up a single document's metadata by doc_id.
+    
+    The index is refreshed lazily before the lookup. If the index cannot be
+    used (e.g. a read-only metadata directory), falls back to scanning the
+    metadata files directly. Malformed metadata files are skipped either
+    way, so they do not hide documents in valid files.
+    
+    Args:
+        metadata_dir: Directory containing metadata JSON files.
+        doc_id: Document ID to look up.
+    
+    Returns:
+        The document's metadata dictionary, or None if not found.
+    """
+    metadata_dir = Path(metadata_dir)
+    if not metadata_dir.is_dir():
+        return None
+    
+    try:
+        conn = sqlite3.connect(build_index(metadata_dir))
+        try:
+            location = conn.execute(
+                "SELECT metadata_file, offset, length FROM documents WHERE doc_id = ?",
+                (doc_id,),
+            ).fetchone()
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError):
+        return _scan_for_document(metadata_dir, doc_id)
+    
+    if location is None:
+        return None
+    
+    metadata_file, offset, length = location
+    try:
+        with open(metadata_dir / metadata_file, "rb") as f:
+            f.seek(offset)
+            doc = _loads(f.read(length))
+    except (OSError, ValueError):
+        doc = None
+    
+    if not isinstance(doc, dict) or doc.get("doc_id") != doc_id:
+        # File changed underneath the index; answer from the source of truth
+        return _scan_for_document(metadata_dir, doc_id)
+    
+    return doc
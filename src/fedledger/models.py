@@ -4,9 +4,38 @@ This module defines the core data structures used throughout the ledger
 for representing Federal Reserve communications with normalized metadata.
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+
+# __slots__ drops the per-instance __dict__; dataclass(slots=True) needs
+# Python 3.10+, so older interpreters get plain frozen dataclasses
+_DATACLASS_OPTIONS = {"frozen": True}
+if sys.version_info >= (3, 10):
+    _DATACLASS_OPTIONS["slots"] = True
+
+# Shared read-only metadata for instances that never get any; replaced by a
+# real dict on the first set_metadata() call
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+
+def _empty_metadata() -> Mapping[str, Any]:
+    """Return the shared empty metadata mapping.
+    
+    dataclasses reject mapping defaults outright, so the sentinel is handed
+    out through a factory that allocates nothing.
+    """
+    return _EMPTY_METADATA
+
+
+def _set_metadata(instance: Any, key: str, value: Any) -> None:
+    """Set a metadata entry, promoting read-only metadata to a dict first."""
+    if not isinstance(instance.metadata, dict):
+        object.__setattr__(instance, "metadata", dict(instance.metadata))
+    instance.metadata[key] = value
 
 
 def _default_timestamp() -> datetime:
@@ -22,7 +51,7 @@ def _default_timestamp() -> datetime:
     return datetime.utcnow()
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Document:
     """Base representation of a Federal Reserve document.
     
@@ -30,6 +59,9 @@ class Document:
     maintaining a clear separation between source preservation (raw data)
     and extracted information (parsed metadata).
     
+    Instances are immutable. Documents without metadata share a read-only
+    empty mapping; use set_metadata() to add entries.
+    
     Attributes:
         doc_id: Stable 16-character identifier derived from source_url.
         source_url: Original URL where the document was retrieved.
@@ -50,7 +82,16 @@ class Document:
     title: Optional[str] = None
     published_date: Optional[datetime] = None
     doc_type: Optional[str] = None
-    metadata: dict = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=_empty_metadata)
+    
+    def set_metadata(self, key: str, value: Any) -> None:
+        """Set a metadata entry.
+        
+        Args:
+            key: Metadata key.
+            value: Metadata value.
+        """
+        _set_metadata(self, key, value)
     
     def __post_init__(self):
         """Validate document fields after initialization."""
@@ -64,7 +105,7 @@ class Document:
             raise ValueError("raw_path is required")
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class FOMCStatement(Document):
     """FOMC (Federal Open Market Committee) statement document.
     
@@ -81,7 +122,7 @@ class FOMCStatement(Document):
     vote_summary: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Speech:
     """Federal Reserve official speech or testimony.
     
@@ -108,10 +149,19 @@ class Speech:
     location: Optional[str] = None
     speech_date: Optional[datetime] = None
     raw_path: Optional[str] = None
-    metadata: dict = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=_empty_metadata)
+    
+    def set_metadata(self, key: str, value: Any) -> None:
+        """Set a metadata entry.
+        
+        Args:
+            key: Metadata key.
+            value: Metadata value.
+        """
+        _set_metadata(self, key, value)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class FetchResult:
     """Result of a document fetch operation.
     
@@ -0,0 +1,139 @@
+"""Sidecar inventory of processed Parquet files.
+
+The pipeline records the row count, size and mtime of every Parquet file it
+writes in ``processed_dir/_stats.json``. Readers such as ``fedledger stats``
+validate the entries against a single directory scan and only open the
+footers of files that changed since they were recorded.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List
+
+
+STATS_FILENAME = "_stats.json"
+
+
+def scan_parquet_files(directory: Path) -> List[os.DirEntry]:
+    """List Parquet files in a directory with a single scandir pass.
+    
+    The returned DirEntry objects carry the stat data gathered during the
+    scan, so callers can read file sizes without another syscall per file.
+    
+    Args:
+        directory: Directory to scan.
+    
+    Returns:
+        Parquet file entries sorted by name.
+    """
+    directory = Path(directory)
+    if not directory.is_dir():
+        return []
+    
+    with os.scandir(directory) as entries:
+        files = [
+            entry for entry in entries
+            if entry.name.endswith(".parquet")
+            and not entry.name.startswith(".")
+            and entry.is_file()
+        ]
+    
+    return sorted(files, key=lambda entry: entry.name)
+
+
+def _load(stats_path: Path) -> Dict[str, Dict[str, Any]]:
+    """Read the sidecar, treating a missing or corrupt file as empty."""
+    try:
+        with open(stats_path, "rb") as f:
+            stats = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return stats if isinstance(stats, dict) else {}
+
+
+def _save(stats_path: Path, stats: Dict[str, Dict[str, Any]]) -> None:
+    """Atomically replace the sidecar contents."""
+    tmp_path = stats_path.with_name(f".{stats_path.name}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(stats, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, stats_path)
+
+
+def _entry(stat: os.stat_result, num_rows: int) -> Dict[str, Any]:
+    """Build a sidecar entry from a stat result."""
+    return {"num_rows": num_rows, "size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+
+def record_parquet_stats(parquet_path: Path, num_rows: int) -> None:
+    """Record a freshly written Parquet file in its directory's sidecar.
+    
+    Args:
+        parquet_path: Path of the Parquet file that was written.
+        num_rows: Number of rows in the file.
+    """
+    parquet_path = Path(parquet_path)
+    stats_path = parquet_path.parent / STATS_FILENAME
+    
+    stats = _load(stats_path)
+    stats[parquet_path.name] = _entry(parquet_path.stat(), num_rows)
+    _save(stats_path, stats)
+
+
+def forget_parquet_stats(parquet_path: Path) -> None:
+    """Drop a Parquet file's entry from its directory's sidecar, if present.
+    
+    Args:
+        parquet_path: Path of a Parquet file that was removed or not
+            finished.
+    """
+    parquet_path = Path(parquet_path)
+    stats_path = parquet_path.parent / STATS_FILENAME
+    
+    stats = _load(stats_path)
+    if stats.pop(parquet_path.name, None) is not None:
+        _save(stats_path, stats)
+
+
+def collect_parquet_stats(processed_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """Return row counts and sizes for all Parquet files in a directory.
+    
+    Sidecar entries whose size and mtime still match the file are used as-is;
+    footers are read only for new or changed files, and the sidecar is
+    rewritten if anything was refreshed or removed.
+    
+    Args:
+        processed_dir: Directory containing Parquet files.
+    
+    Returns:
+        Mapping of file name to ``{"num_rows", "size", "mtime"}``, ordered by
+        file name.
+    """
+    processed_dir = Path(processed_dir)
+    stats_path = processed_dir / STATS_FILENAME
+    
+    recorded = _load(stats_path)
+    current = {}
+    
+    for entry in scan_parquet_files(processed_dir):
+        stat = entry.stat()
+        cached = recorded.get(entry.name)
+        if (
+            cached
+            and cached.get("size") == stat.st_size
+            and cached.get("mtime") == stat.st_mtime_ns
+        ):
+            current[entry.name] = cached
+            continue
+        
+        import pyarrow.parquet as pq
+        
+        current[entry.name] = _entry(stat, pq.read_metadata(entry.path).num_rows)
+    
+    if current != recorded and processed_dir.is_dir():
+        try:
+            _save(stats_path, current)
+        except OSError:
+            pass
+    
+    return current
@@ -5,16 +5,34 @@ parsing, and storing Federal Reserve documents.
 """
 
 import asyncio
+import fnmatch
+import os
+import pickle
+import re
+import shutil
+import sys
+import threading
+from collections import deque
+from itertools import chain
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime
+from typing import (
+    List, Optional, Dict, Any, Callable, Deque, Iterator, Set, Tuple, Union,
+)
+from concurrent.futures import (
+    Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed,
+)
+from datetime import datetime, timezone
 import json
 
-import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from fedledger.config import FedLedgerConfig
 from fedledger.logging_config import get_logger
 from fedledger.pydantic_models import (
@@ -24,12 +42,272 @@ from fedledger.pydantic_models import (
     DocumentModel,
     DocumentType,
 )
-from fedledger.schema import get_schema_for_doc_type, validate_rows
-from fedledger.ids import generate_doc_id
+from fedledger.schema import validate_rows
+from fedledger.ids import (
+    HASH_SCHEME,
+    HASH_SCHEME_ENV,
+    HASH_SCHEME_FILE,
+    HASH_SCHEMES,
+    detect_hash_scheme,
+    generate_doc_id,
+    generate_doc_ids,
+    validate_doc_id,
+)
+from fedledger.parquet_stats import forget_parquet_stats, record_parquet_stats
 
 
 logger = get_logger(__name__)
 
+# Threads persisting raw files while later documents are parsed
+_RAW_WRITE_WORKERS = 2
+
+# Queued raw-file copies allowed before process_document() waits for the
+# oldest, bounding the work left for flush_raw_writes()
+_MAX_PENDING_RAW_WRITES = 64
+
+# Pipeline copy owned by a process-pool worker, set by _init_worker()
+_worker_pipeline: Optional["Pipeline"] = None
+
+
+def _init_worker(pipeline: "Pipeline") -> None:
+    """Install the pipeline (config and extractor registry) in a worker."""
+    global _worker_pipeline
+    _worker_pipeline = pipeline
+
+
+def _process_in_worker(
+    source_path: Path,
+    doc_type: DocumentType,
+    doc_id: Optional[str] = None,
+    fetch_timestamp: Optional[datetime] = None,
+) -> Optional[DocumentModel]:
+    """Process a document with the worker's pipeline."""
+    document = _worker_pipeline.process_document(
+        source_path, doc_type, doc_id=doc_id, fetch_timestamp=fetch_timestamp
+    )
+    if document is not None and _worker_pipeline.flush_raw_writes():
+        return None
+    return document
+
+
+def _save_raw_copy(source_path: Path, raw_path: Path) -> None:
+    """Place a copy of a source file at its raw path.
+    
+    The raw file is an independent copy (made at the OS level, e.g. with
+    sendfile on Linux), not a hard link, so later in-place writes to the
+    source such as a re-download cannot change the preserved file. The copy
+    is moved into place with os.replace, so an existing raw file is swapped
+    out rather than truncated (ledgers written by earlier versions may hold
+    raw files hard-linked to their sources).
+    
+    Args:
+        source_path: File to preserve.
+        raw_path: Destination in the raw directory.
+    """
+    try:
+        if os.path.samefile(source_path, raw_path):
+            return
+    except FileNotFoundError:
+        pass
+    
+    tmp_path = raw_path.with_name(
+        f".{raw_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    try:
+        shutil.copyfile(source_path, tmp_path)
+        os.replace(tmp_path, raw_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _read_file_bytes(path: Path) -> bytes:
+    """Read a whole file with one read call sized from fstat.
+    
+    Args:
+        path: File to read.
+    
+    Returns:
+        File contents.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size) if size else b""
+        if len(data) < size or not size:
+            # Short read or a file with no reported size (e.g. procfs):
+            # read the rest through a buffered file object
+            with os.fdopen(os.dup(fd), "rb") as f:
+                data += f.read()
+    finally:
+        os.close(fd)
+    return data
+
+
+@lru_cache(maxsize=64)
+def _compiled_pattern(pattern: str) -> Callable[[str], Optional["re.Match"]]:
+    """Return the match function for an fnmatch-style pattern.
+    
+    Args:
+        pattern: fnmatch-style pattern (case-sensitive).
+    
+    Returns:
+        Bound match method of the compiled pattern.
+    """
+    return re.compile(fnmatch.translate(pattern)).match
+
+
+def _has_magic(part: str) -> bool:
+    """Return whether a path component contains glob wildcards."""
+    return any(char in part for char in "*?[")
+
+
+def _split_literal_prefix(pattern: str) -> Tuple[str, str]:
+    """Split leading directory components without wildcards off a pattern.
+    
+    Args:
+        pattern: Glob pattern relative to a directory.
+    
+    Returns:
+        Tuple of (literal directory prefix, remaining pattern), e.g.
+        ("minutes/2024", "*.html") for "minutes/2024/*.html".
+    """
+    parts = pattern.split("/")
+    literal = 0
+    while (
+        literal < len(parts) - 1
+        and parts[literal]
+        and not _has_magic(parts[literal])
+    ):
+        literal += 1
+    return "/".join(parts[:literal]), "/".join(parts[literal:])
+
+
+def _scandir_filtered(
+    directory: Path,
+    pattern: str,
+    recursive: bool = False,
+) -> Iterator[os.DirEntry]:
+    """Yield regular files in a directory whose names match a pattern.
+    
+    Uses os.scandir so file type checks come from the cached DirEntry data
+    rather than a stat() call per entry.
+    
+    Args:
+        directory: Directory to scan.
+        pattern: fnmatch-style pattern matched against file names.
+        recursive: Whether to descend into subdirectories (symlinked
+                   directories are not followed).
+    
+    Yields:
+        DirEntry for each matching regular file, in directory order.
+    """
+    yield from _scandir_matching(directory, _compiled_pattern(pattern), recursive)
+
+
+def _scandir_matching(
+    directory: str,
+    match: Callable[[str], Any],
+    recursive: bool,
+) -> Iterator[os.DirEntry]:
+    """Recursive body of _scandir_filtered with the pattern pre-compiled."""
+    with os.scandir(directory) as entries:
+        subdirs = []
+        for entry in entries:
+            if recursive and entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif match(entry.name) and entry.is_file():
+                yield entry
+    
+    for subdir in subdirs:
+        yield from _scandir_matching(subdir, match, recursive)
+
+
+def _stored_hash_scheme(config: FedLedgerConfig) -> Optional[str]:
+    """Infer the doc_id scheme of a ledger written before scheme tracking.
+    
+    The first stored metadata record whose doc_id one of the schemes
+    reproduces decides. A ledger with pipeline output (raw files named
+    ``<doc_id>.<ext>`` or ``*_documents.parquet`` files) but no such record
+    predates BLAKE2b IDs, so it is taken to use SHA-1. Other files, such as
+    a README in the raw directory, do not count.
+    
+    Args:
+        config: Configuration of the ledger.
+    
+    Returns:
+        The ledger's scheme, or None if the ledger holds no documents.
+    """
+    for metadata_path in sorted(config.metadata_dir.glob("*_metadata.json")):
+        try:
+            records = json.loads(metadata_path.read_bytes())
+        except (OSError, ValueError):
+            continue
+        for record in records if isinstance(records, list) else []:
+            if not isinstance(record, dict):
+                continue
+            source_url, doc_id = record.get("source_url"), record.get("doc_id")
+            if source_url and doc_id:
+                scheme = detect_hash_scheme(source_url, doc_id)
+                if scheme is not None:
+                    return scheme
+    
+    raw_outputs = (
+        path for path in config.raw_dir.iterdir()
+        if validate_doc_id(path.name.split(".", 1)[0])
+    )
+    parquet_outputs = config.processed_dir.glob("*_documents.parquet")
+    if any(path.is_file() for path in chain(raw_outputs, parquet_outputs)):
+        return "sha1"
+    
+    return None
+
+
+def _resolve_hash_scheme(config: FedLedgerConfig) -> str:
+    """Return the doc_id scheme for a ledger, recording it on first use.
+    
+    The scheme is read from HASH_SCHEME_FILE in the data directory. Ledgers
+    without the file keep the scheme of the documents they already hold;
+    empty ledgers use HASH_SCHEME. The result is written to the file so
+    later runs do not need to infer it again, except in dry-run mode.
+    
+    Args:
+        config: Configuration of the ledger (directories must exist).
+    
+    Returns:
+        Hash scheme name.
+    
+    Raises:
+        ValueError: If the recorded scheme, or the FEDLEDGER_HASH_SCHEME
+            default a new ledger would record, is unknown.
+    """
+    scheme_path = config.data_dir / HASH_SCHEME_FILE
+    try:
+        scheme = scheme_path.read_text(encoding="utf-8").strip()
+    except FileNotFoundError:
+        scheme = None
+    
+    if scheme is not None:
+        if scheme not in HASH_SCHEMES:
+            raise ValueError(f"Unknown doc_id hash scheme {scheme!r} in {scheme_path}")
+    else:
+        scheme = _stored_hash_scheme(config)
+        if scheme is None:
+            if HASH_SCHEME not in HASH_SCHEMES:
+                raise ValueError(
+                    f"Unknown doc_id hash scheme {HASH_SCHEME!r} in {HASH_SCHEME_ENV}. "
+                    f"Must be one of: {', '.join(HASH_SCHEMES)}"
+                )
+            scheme = HASH_SCHEME
+        if not config.dry_run:
+            scheme_path.write_text(f"{scheme}\n", encoding="utf-8")
+    
+    if scheme != HASH_SCHEME:
+        logger.info(
+            f"Using the ledger's {scheme} doc_id scheme (default is {HASH_SCHEME})"
+        )
+    return scheme
+
 
 class PipelineResult:
     """Result of a pipeline execution.
@@ -94,20 +372,98 @@ class Pipeline:
         self.config = config or FedLedgerConfig()
         self.config.ensure_directories()
         
+        # doc_id scheme of this ledger; existing ledgers keep theirs
+        self.hash_scheme = _resolve_hash_scheme(self.config)
+        
         # Registry of extractors by document type
         self.extractors: Dict[str, Callable] = {}
+        
+        # Open Parquet writers with their row counts and doc_ids, by output
+        # path. Writers stay open between write_parquet() calls only inside
+        # a with block, where JSON metadata records also accumulate per path.
+        self._writers: Dict[Path, pq.ParquetWriter] = {}
+        self._rows_written: Dict[Path, int] = {}
+        self._written_ids: Dict[Path, Set[str]] = {}
+        self._json_records: Dict[Path, Dict[str, Dict[str, Any]]] = {}
+        self._keep_writers_open = False
+        
+        # Raw-file writes in flight on background threads, and raw paths
+        # already written or queued by this pipeline
+        self._init_raw_writer()
+        self._raw_saved: Set[Path] = set()
+    
+    def _init_raw_writer(self) -> None:
+        """Set up the pending queue for background raw-file writes.
+        
+        The writer threads are started by the first raw write, so pipelines
+        that never save raw files (or only read outputs) never create them.
+        """
+        self._raw_write_pool: Optional[ThreadPoolExecutor] = None
+        self._raw_write_pool_lock = threading.Lock()
+        self._raw_writes: Deque[Tuple[Path, Future]] = deque()
+        self._raw_write_failures: List[Tuple[Path, BaseException]] = []
+    
+    def __enter__(self) -> "Pipeline":
+        """Keep Parquet writers open until the block exits.
+        
+        Repeated write_parquet() calls for the same path then append row
+        groups to one file instead of rewriting it, and repeated
+        write_json_metadata() calls add to the file's records. Documents
+        already written to a path in the block are skipped, so rerunning a
+        batch leaves both outputs with one record per doc_id.
+        """
+        self._keep_writers_open = True
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Close all open Parquet writers."""
+        self._keep_writers_open = False
+        self.close()
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle without open writers (for process-pool workers)."""
+        state = self.__dict__.copy()
+        state["_writers"] = {}
+        state["_rows_written"] = {}
+        state["_written_ids"] = {}
+        state["_json_records"] = {}
+        state["_raw_saved"] = set()
+        del state["_raw_write_pool"], state["_raw_write_pool_lock"]
+        del state["_raw_writes"], state["_raw_write_failures"]
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a pickled pipeline with its own raw-file writer."""
+        self.__dict__.update(state)
+        self._init_raw_writer()
+    
+    def close(self) -> None:
+        """Finish pending raw-file writes and all open Parquet files.
+        
+        The raw-file writer threads are stopped too; a later raw write
+        starts new ones.
+        """
+        self.flush_raw_writes()
+        with self._raw_write_pool_lock:
+            pool, self._raw_write_pool = self._raw_write_pool, None
+        if pool is not None:
+            pool.shutdown()
+        for output_path in list(self._writers):
+            self._close_writer(output_path)
+        self._json_records.clear()
     
     def register_extractor(
         self,
         doc_type: DocumentType,
-        extractor: Callable[[str, str, str, str], DocumentModel]
+        extractor: Callable[[Union[str, bytes], str, str, str], DocumentModel]
     ):
         """Register an extractor function for a document type.
         
         Args:
             doc_type: Document type to register extractor for.
-            extractor: Function that takes (html_content, doc_id, source_url, raw_path)
-                      and returns a DocumentModel instance.
+            extractor: Function that takes (content, doc_id, source_url, raw_path)
+                      and returns a DocumentModel instance. content is the
+                      decoded text for HTML files and the raw bytes for PDFs.
         """
         self.extractors[doc_type.value] = extractor
         logger.info(f"Registered extractor for {doc_type.value}")
@@ -119,6 +475,12 @@ class Pipeline:
     ) -> List[Path]:
         """Discover files in a local directory.
         
+        File name patterns (e.g. "*.html") and recursive "**/" name patterns
+        are matched during a single os.scandir pass, starting from any
+        literal directory prefix (e.g. "minutes/" in "minutes/*.html") so
+        unrelated subtrees are never listed; other glob patterns fall back
+        to Path.glob. Results are in directory order, not sorted.
+        
         Args:
             directory: Directory to search.
             pattern: Glob pattern for files.
@@ -131,103 +493,253 @@ class Pipeline:
             logger.warning(f"Directory does not exist: {directory}")
             return []
         
-        files = list(directory.glob(pattern))
+        prefix, rest = _split_literal_prefix(pattern)
+        recursive = rest.startswith("**/")
+        name_pattern = rest[3:] if recursive else rest
+        
+        if "/" in name_pattern:
+            # Patterns spanning path components still need glob
+            files = list(directory.glob(pattern))
+        else:
+            base = directory / prefix if prefix else directory
+            files = [
+                Path(entry.path)
+                for entry in _scandir_filtered(base, name_pattern, recursive)
+            ] if base.is_dir() else []
+        
         logger.info(f"Discovered {len(files)} files in {directory}")
         return files
     
+    def discover_local_files_iter(
+        self,
+        directory: Path,
+        pattern: str = "*.html"
+    ) -> Iterator[os.DirEntry]:
+        """Lazily discover files in a local directory.
+        
+        Unlike discover_local_files, entries are yielded as the directory is
+        scanned, so callers that only need the first few matches stop early.
+        The yielded DirEntry objects cache their stat() result.
+        
+        Args:
+            directory: Directory to search.
+            pattern: fnmatch-style pattern matched against file names.
+        
+        Yields:
+            DirEntry for each matching regular file.
+        """
+        directory = Path(directory)
+        if not directory.is_dir():
+            logger.warning(f"Directory does not exist: {directory}")
+            return
+        
+        yield from _scandir_filtered(directory, pattern)
+    
     def process_document(
         self,
         source_path: Path,
         doc_type: DocumentType,
         source_url: Optional[str] = None,
+        doc_id: Optional[str] = None,
+        fetch_timestamp: Optional[datetime] = None,
     ) -> Optional[DocumentModel]:
         """Process a single document.
         
+        With save_raw enabled, the raw copy is written on a background
+        thread so the next document can be parsed meanwhile; call
+        flush_raw_writes() (process_documents_parallel() and close() do)
+        before reading it.
+        
         Args:
             source_path: Path to source file.
             doc_type: Type of document.
             source_url: Optional source URL. If None, uses file path.
+            doc_id: Optional precomputed doc_id for the URL. If None, it is
+                generated here.
+            fetch_timestamp: Fetch time for documents built without an
+                extractor. Defaults to now (UTC).
         
         Returns:
             Processed DocumentModel or None if failed.
         """
         try:
+            # Read the enum value once; it is used for lookups, logs and the model
+            doc_type_value = doc_type.value
+            
             # Generate doc_id
             url = source_url or f"file://{source_path}"
-            doc_id = generate_doc_id(url)
-            
-            doc_logger = get_logger(__name__, doc_id=doc_id, doc_type=doc_type.value)
-            doc_logger.info(f"Processing document from {source_path}")
+            if doc_id is None:
+                doc_id = generate_doc_id(url, self.hash_scheme)
             
-            # Read raw content
-            with open(source_path, "r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
+            # Per-document context goes in extra= rather than a LoggerAdapter
+            log_context = {"doc_id": doc_id, "doc_type": doc_type_value}
+            logger.info(f"Processing document from {source_path}", extra=log_context)
             
             # Determine raw path
             if self.config.save_raw:
                 raw_filename = f"{doc_id}{source_path.suffix}"
                 raw_path = self.config.raw_dir / raw_filename
                 
-                # Save raw file if not already there
-                if not raw_path.exists() or self.config.overwrite:
-                    raw_path.write_text(content, encoding="utf-8")
-                    doc_logger.debug(f"Saved raw file to {raw_path}")
+                # Save raw file if not already there. The file is copied in
+                # the background; flush_raw_writes() waits for it.
+                if self.config.overwrite or (
+                    raw_path not in self._raw_saved and not raw_path.exists()
+                ):
+                    self._submit_raw_write(source_path, raw_path)
+                    logger.debug(
+                        f"Queued raw file copy to {raw_path}", extra=log_context
+                    )
             else:
                 raw_path = source_path
             
             # Get extractor
-            extractor = self.extractors.get(doc_type.value)
+            extractor = self.extractors.get(doc_type_value)
             
             if extractor:
-                # Use custom extractor
+                # Use custom extractor. The file is only read here: as bytes,
+                # with text decoded for everything but PDFs.
+                data = _read_file_bytes(source_path)
+                if source_path.suffix.lower() == ".pdf":
+                    content = data
+                else:
+                    content = data.decode("utf-8", errors="ignore")
                 document = extractor(content, doc_id, url, str(raw_path))
             else:
                 # Use default: create base model
-                doc_logger.warning(f"No extractor registered for {doc_type.value}, using base model")
-                document = BaseDocument(
+                logger.warning(
+                    f"No extractor registered for {doc_type_value}, using base model",
+                    extra=log_context,
+                )
+                # Every field here is generated by the pipeline itself, so
+                # skip validation
+                document = BaseDocument.model_construct_trusted(
                     doc_id=doc_id,
                     source_url=url,
-                    fetch_timestamp=datetime.utcnow(),
+                    fetch_timestamp=fetch_timestamp or datetime.now(timezone.utc),
                     raw_path=str(raw_path),
                     content_type="text/html" if source_path.suffix == ".html" else "application/pdf",
-                    doc_type=doc_type,
+                    doc_type=doc_type_value,
                 )
             
-            doc_logger.info(f"Successfully processed document {doc_id}")
+            logger.info(f"Successfully processed document {doc_id}", extra=log_context)
             return document
             
         except Exception as e:
             logger.error(f"Failed to process {source_path}: {e}", exc_info=True)
             return None
     
+    def _submit_raw_write(self, source_path: Path, raw_path: Path) -> None:
+        """Queue a raw file to be saved on a background thread.
+        
+        Args:
+            source_path: File to preserve.
+            raw_path: Destination path.
+        """
+        self._raw_saved.add(raw_path)
+        while len(self._raw_writes) >= _MAX_PENDING_RAW_WRITES:
+            try:
+                oldest_path, future = self._raw_writes.popleft()
+            except IndexError:
+                break
+            error = future.exception()
+            if error is not None:
+                self._raw_write_failures.append((oldest_path, error))
+        future = self._raw_writer().submit(_save_raw_copy, source_path, raw_path)
+        self._raw_writes.append((raw_path, future))
+    
+    def _raw_writer(self) -> ThreadPoolExecutor:
+        """Return the raw-file writer pool, starting it on first use."""
+        pool = self._raw_write_pool
+        if pool is None:
+            with self._raw_write_pool_lock:
+                pool = self._raw_write_pool
+                if pool is None:
+                    pool = self._raw_write_pool = ThreadPoolExecutor(
+                        max_workers=_RAW_WRITE_WORKERS,
+                        thread_name_prefix="fedledger-raw",
+                    )
+        return pool
+    
+    def flush_raw_writes(self) -> Set[str]:
+        """Wait for all queued raw-file writes to finish.
+        
+        Returns:
+            Raw paths (as strings) whose write failed since the last flush.
+        """
+        failures = self._raw_write_failures
+        while self._raw_writes:
+            try:
+                raw_path, future = self._raw_writes.popleft()
+            except IndexError:
+                break
+            error = future.exception()
+            if error is not None:
+                failures.append((raw_path, error))
+        
+        self._raw_write_failures = []
+        failed = set()
+        for raw_path, error in failures:
+            self._raw_saved.discard(raw_path)
+            failed.add(str(raw_path))
+            logger.error(f"Failed to save raw file {raw_path}: {error}")
+        return failed
+    
     def process_documents_parallel(
         self,
         source_paths: List[Path],
         doc_type: DocumentType,
+        fetch_timestamp: Optional[datetime] = None,
     ) -> List[DocumentModel]:
         """Process multiple documents in parallel.
         
         Args:
             source_paths: List of source file paths.
             doc_type: Type of documents.
+            fetch_timestamp: Fetch time shared by the whole batch. Defaults
+                to now (UTC).
         
         Returns:
             List of processed documents.
         """
         documents = []
         
+        # Hash all file URLs in one pass up front, and stamp the batch once
+        doc_ids = generate_doc_ids(
+            (f"file://{path}" for path in source_paths), self.hash_scheme
+        )
+        fetch_timestamp = fetch_timestamp or datetime.now(timezone.utc)
+        
         if not self.config.parallel:
             # Sequential processing
-            for path in source_paths:
-                doc = self.process_document(path, doc_type)
+            for path, doc_id in zip(source_paths, doc_ids):
+                doc = self.process_document(
+                    path, doc_type, doc_id=doc_id, fetch_timestamp=fetch_timestamp
+                )
                 if doc:
                     documents.append(doc)
         else:
             # Parallel processing
-            with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+            if self._use_process_pool():
+                executor = ProcessPoolExecutor(
+                    max_workers=self.config.max_workers,
+                    initializer=_init_worker,
+                    initargs=(self,),
+                )
+                process = _process_in_worker
+            else:
+                executor = ThreadPoolExecutor(max_workers=self.config.max_workers)
+                process = self.process_document
+            
+            with executor:
                 futures = {
-                    executor.submit(self.process_document, path, doc_type): path
-                    for path in source_paths
+                    executor.submit(
+                        process,
+                        path,
+                        doc_type,
+                        doc_id=doc_id,
+                        fetch_timestamp=fetch_timestamp,
+                    ): path
+                    for path, doc_id in zip(source_paths, doc_ids)
                 }
                 
                 for future in as_completed(futures):
@@ -239,8 +751,43 @@ class Pipeline:
                         path = futures[future]
                         logger.error(f"Failed to process {path}: {e}")
         
+        # Documents whose raw copy could not be saved count as failed
+        failed_raw_paths = self.flush_raw_writes()
+        if failed_raw_paths:
+            documents = [
+                doc for doc in documents if doc.raw_path not in failed_raw_paths
+            ]
+        
         return documents
     
+    def _use_process_pool(self) -> bool:
+        """Decide whether parallel processing should use worker processes.
+        
+        Processes sidestep the GIL for CPU-bound extraction, but the
+        extractor registry must be picklable to reach the workers. On
+        free-threaded builds with the GIL disabled, threads already run in
+        parallel and avoid the pickling overhead.
+        
+        Returns:
+            True to use a ProcessPoolExecutor, False for threads.
+        """
+        if self.config.executor_kind != "process":
+            return False
+        
+        is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+        if is_gil_enabled is not None and not is_gil_enabled():
+            return False
+        
+        try:
+            pickle.dumps(self)
+        except Exception as e:
+            logger.warning(
+                f"Extractors cannot be sent to worker processes ({e}); using threads"
+            )
+            return False
+        
+        return True
+    
     def write_parquet(
         self,
         documents: List[DocumentModel],
@@ -249,11 +796,27 @@ class Pipeline:
     ) -> None:
         """Write documents to Parquet file.
         
+        The documents are written as one zstd-compressed row group, or
+        several if config.parquet_row_group_size is smaller. Inside a
+        ``with pipeline:`` block the file stays open and later calls for the
+        same path append row groups, skipping documents whose doc_id the
+        file already holds; otherwise it is finished immediately. If the
+        write fails, the unfinished file is removed and its _stats.json
+        entry dropped (inside a with block this discards the row groups
+        already written to it, which have no footer yet).
+        
         Args:
             documents: List of document models.
             output_path: Output Parquet file path.
             doc_type: Document type for schema validation.
         """
+        written_ids = self._written_ids.get(output_path)
+        if written_ids and documents:
+            documents = [doc for doc in documents if doc.doc_id not in written_ids]
+            if not documents:
+                logger.info(f"All documents are already in {output_path}")
+                return
+        
         if not documents:
             logger.warning("No documents to write")
             return
@@ -261,36 +824,99 @@ class Pipeline:
         # Convert to rows
         rows = [doc.to_parquet_row() for doc in documents]
         
-        # Validate schema
-        validate_rows(rows, doc_type.value)
+        # Validate against the schema; this also builds the table, with
+        # missing nullable columns as typed nulls and extra keys (meta_*)
+        # dropped
+        table = validate_rows(rows, doc_type.value)
         
-        # Create DataFrame
-        df = pd.DataFrame(rows)
+        writer = self._get_writer(output_path, table.schema)
+        try:
+            row_group_size = (
+                self.config.parquet_row_group_size or max(1, table.num_rows)
+            )
+            writer.write_table(table, row_group_size=row_group_size)
+        except BaseException:
+            self._abort_writer(output_path)
+            raise
+        self._rows_written[output_path] += table.num_rows
+        self._written_ids[output_path].update(doc.doc_id for doc in documents)
         
-        # Convert datetime columns
-        datetime_cols = ["fetch_timestamp", "published_date", "meeting_date", "speech_date"]
-        for col in datetime_cols:
-            if col in df.columns:
-                df[col] = pd.to_datetime(df[col], utc=True)
+        if not self._keep_writers_open:
+            self._close_writer(output_path)
         
-        # Get schema and add missing nullable columns
-        schema = get_schema_for_doc_type(doc_type.value)
+        logger.info(f"Wrote {len(documents)} documents to {output_path}")
+    
+    def _get_writer(self, output_path: Path, schema: pa.Schema) -> pq.ParquetWriter:
+        """Return the open writer for a path, creating it if needed.
         
-        # Add missing nullable columns with None
-        for field in schema:
-            if field.name not in df.columns and field.nullable:
-                df[field.name] = None
+        Args:
+            output_path: Output Parquet file path.
+            schema: Schema of the tables to be written.
         
-        # Reorder columns to match schema
-        df = df[[field.name for field in schema if field.name in df.columns]]
+        Returns:
+            ParquetWriter for the path.
+        """
+        writer = self._writers.get(output_path)
+        if writer is None:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            # Files are written once and scanned many times: zstd, format
+            # 2.6 encodings, statistics for predicate pushdown, and pages
+            # small enough that each column chunk has several
+            writer = pq.ParquetWriter(
+                output_path,
+                schema,
+                version="2.6",
+                compression="zstd",
+                compression_level=3,
+                use_dictionary=True,
+                write_statistics=True,
+                data_page_size=self.config.parquet_page_size,
+                write_batch_size=4096,
+            )
+            self._writers[output_path] = writer
+            self._rows_written[output_path] = 0
+            self._written_ids[output_path] = set()
+        return writer
+    
+    def _close_writer(self, output_path: Path) -> None:
+        """Close a path's writer and record the finished file's stats.
         
-        # Write to Parquet without strict schema enforcement
-        table = pa.Table.from_pandas(df, preserve_index=False)
+        Stats are only recorded once the file is complete; if closing
+        fails, the file is discarded as in _abort_writer().
         
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        pq.write_table(table, output_path)
+        Args:
+            output_path: Output Parquet file path.
+        """
+        writer = self._writers.pop(output_path)
+        del self._written_ids[output_path]
+        num_rows = self._rows_written.pop(output_path)
+        try:
+            writer.close()
+        except BaseException:
+            self._discard_output(output_path)
+            raise
+        record_parquet_stats(output_path, num_rows)
+    
+    def _abort_writer(self, output_path: Path) -> None:
+        """Close a path's writer after a failed write and discard the file.
         
-        logger.info(f"Wrote {len(documents)} documents to {output_path}")
+        Args:
+            output_path: Output Parquet file path.
+        """
+        writer = self._writers.pop(output_path)
+        del self._written_ids[output_path]
+        del self._rows_written[output_path]
+        try:
+            writer.close()
+        except Exception as e:
+            logger.debug(f"Ignoring error closing writer for {output_path}: {e}")
+        self._discard_output(output_path)
+    
+    @staticmethod
+    def _discard_output(output_path: Path) -> None:
+        """Remove an unfinished Parquet file and its _stats.json entry."""
+        output_path.unlink(missing_ok=True)
+        forget_parquet_stats(output_path)
     
     def write_json_metadata(
         self,
@@ -299,6 +925,11 @@ class Pipeline:
     ) -> None:
         """Write documents metadata to JSON file.
         
+        Inside a ``with pipeline:`` block the file holds every document
+        written to it in the block, matching the appended Parquet file: a
+        document whose doc_id is already there keeps its first record.
+        Otherwise the file is replaced.
+        
         Args:
             documents: List of document models.
             output_path: Output JSON file path.
@@ -308,14 +939,27 @@ class Pipeline:
             return
         
         # Convert to JSON-serializable format
-        metadata = [doc.to_json_metadata() for doc in documents]
+        if self._keep_writers_open:
+            records = self._json_records.setdefault(output_path, {})
+            for doc in documents:
+                if doc.doc_id not in records:
+                    records[doc.doc_id] = doc.to_json_metadata()
+            metadata = list(records.values())
+        else:
+            metadata = [doc.to_json_metadata() for doc in documents]
         
-        # Write to JSON
+        # Write to JSON; orjson encodes in one native call, the stdlib
+        # encoder is the fallback when the speedups extra is not installed
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, indent=2, default=str)
+        if orjson is not None:
+            output_path.write_bytes(
+                orjson.dumps(metadata, default=str, option=orjson.OPT_INDENT_2)
+            )
+        else:
+            with open(output_path, "w", encoding="utf-8") as f:
+                json.dump(metadata, f, indent=2, default=str)
         
-        logger.info(f"Wrote metadata for {len(documents)} documents to {output_path}")
+        logger.info(f"Wrote metadata for {len(metadata)} documents to {output_path}")
     
     def run(
         self,
@@ -337,8 +981,10 @@ class Pipeline:
         """
         result = PipelineResult()
         
+        doc_type_value = doc_type.value
+        
         try:
-            logger.info(f"Starting pipeline for {doc_type.value} documents")
+            logger.info(f"Starting pipeline for {doc_type_value} documents")
             
             # 1. Discover documents
             files = self.discover_local_files(source_directory, pattern)
@@ -363,12 +1009,14 @@ class Pipeline:
                 return result
             
             # 3. Write Parquet output
-            parquet_path = self.config.processed_dir / f"{doc_type.value}_documents.parquet"
+            parquet_path = (
+                self.config.processed_dir / f"{doc_type_value}_documents.parquet"
+            )
             self.write_parquet(documents, parquet_path, doc_type)
             result.output_files.append(parquet_path)
             
             # 4. Write JSON metadata
-            json_path = self.config.metadata_dir / f"{doc_type.value}_metadata.json"
+            json_path = self.config.metadata_dir / f"{doc_type_value}_metadata.json"
             self.write_json_metadata(documents, json_path)
             result.output_files.append(json_path)
             
@@ -4,12 +4,17 @@ This module provides type-safe, validated Pydantic models for all document types
 with conversion methods for different data formats.
 """
 
-from datetime import datetime
-from typing import Optional, Dict, Any, List
+import sys
+from datetime import datetime, timezone
+from typing import Annotated, Optional, Dict, Any, List, Union
 from pathlib import Path
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import (
+    BaseModel, Discriminator, Field, Tag, TypeAdapter, field_validator, ConfigDict,
+)
 from enum import Enum
 
+from fedledger.ids import validate_doc_id as _is_valid_doc_id
+
 
 class DocumentType(str, Enum):
     """Valid document types."""
@@ -21,11 +26,29 @@ class DocumentType(str, Enum):
     REPORT = "report"
 
 
+# Interned Parquet column names by metadata key
+_META_COLUMNS: Dict[str, str] = {}
+
+
+def _meta_column(key: str) -> str:
+    """Return the interned Parquet column name for a metadata key.
+    
+    Field-name literals are interned by the compiler already; metadata
+    column names are built at runtime, so intern them once here and reuse
+    the same string object for every row. Hot loops look the key up in
+    _META_COLUMNS directly and only call this on a miss.
+    """
+    column = _META_COLUMNS.get(key)
+    if column is None:
+        column = _META_COLUMNS.setdefault(key, sys.intern(f"meta_{key}"))
+    return column
+
+
 class BaseDocument(BaseModel):
     """Base Pydantic model for all Federal Reserve documents.
     
     Provides validation, normalization, and conversion methods for
-    document metadata.
+    document metadata. Instances are immutable once built.
     
     Attributes:
         doc_id: Stable 16-character identifier derived from source_url.
@@ -40,7 +63,7 @@ class BaseDocument(BaseModel):
     """
     
     doc_id: str = Field(..., min_length=16, max_length=16, description="Stable 16-char hex ID")
-    source_url: str = Field(..., description="Original source URL")
+    source_url: str = Field(..., min_length=1, description="Original source URL")
     fetch_timestamp: datetime = Field(..., description="When document was fetched")
     raw_path: str = Field(..., description="Path to raw content")
     content_type: str = Field(..., description="MIME type")
@@ -51,29 +74,18 @@ class BaseDocument(BaseModel):
     
     model_config = ConfigDict(
         use_enum_values=True,
-        validate_assignment=True,
-        str_strip_whitespace=True,
+        frozen=True,
     )
     
     @field_validator("doc_id")
     @classmethod
     def validate_doc_id(cls, v: str) -> str:
         """Validate doc_id is 16-character hex string."""
-        if not v or len(v) != 16:
-            raise ValueError(f"doc_id must be 16 characters, got: {v}")
-        try:
-            int(v, 16)
-        except ValueError:
+        # Length is already enforced by the Field constraints
+        v = v.lower()
+        if not _is_valid_doc_id(v):
             raise ValueError(f"doc_id must be hexadecimal, got: {v}")
-        return v.lower()
-    
-    @field_validator("source_url")
-    @classmethod
-    def validate_url(cls, v: str) -> str:
-        """Validate source URL is not empty."""
-        if not v or not v.strip():
-            raise ValueError("source_url cannot be empty")
-        return v.strip()
+        return v
     
     def to_parquet_row(self) -> Dict[str, Any]:
         """Convert to dictionary suitable for Parquet storage.
@@ -93,8 +105,10 @@ class BaseDocument(BaseModel):
         }
         
         # Flatten metadata into columns with prefix
-        for key, value in self.metadata.items():
-            row[f"meta_{key}"] = value
+        if self.metadata:
+            cached_column = _META_COLUMNS.get
+            for key, value in self.metadata.items():
+                row[cached_column(key) or _meta_column(key)] = value
         
         return row
     
@@ -117,6 +131,28 @@ class BaseDocument(BaseModel):
             Validated BaseDocument instance.
         """
         return cls(**metadata)
+    
+    @classmethod
+    def model_construct_trusted(cls, **values: Any) -> "BaseDocument":
+        """Create instance from internally generated values without validation.
+        
+        Only use this for values the pipeline produced itself (doc_id from
+        generate_doc_id, URLs and paths it built); untrusted input must go
+        through from_raw_metadata(). The result matches a validated instance:
+        enum values are stored as plain strings (use_enum_values) and
+        metadata defaults to an empty dict.
+        
+        Args:
+            **values: Field values.
+        
+        Returns:
+            Unvalidated instance.
+        """
+        doc_type = values.get("doc_type")
+        if isinstance(doc_type, DocumentType):
+            values["doc_type"] = doc_type.value
+        values.setdefault("metadata", {})
+        return cls.model_construct(**values)
 
 
 class FOMCStatementModel(BaseDocument):
@@ -149,7 +185,14 @@ class FOMCStatementModel(BaseDocument):
         return row
     
     @classmethod
-    def from_html(cls, html_content: str, doc_id: str, source_url: str, raw_path: str) -> "FOMCStatementModel":
+    def from_html(
+        cls,
+        html_content: str,
+        doc_id: str,
+        source_url: str,
+        raw_path: str,
+        fetch_timestamp: Optional[datetime] = None,
+    ) -> "FOMCStatementModel":
         """Create instance from HTML content.
         
         Args:
@@ -157,6 +200,7 @@ class FOMCStatementModel(BaseDocument):
             doc_id: Document ID.
             source_url: Source URL.
             raw_path: Path to raw file.
+            fetch_timestamp: Fetch time shared by a batch. Defaults to now (UTC).
         
         Returns:
             Parsed FOMCStatementModel instance.
@@ -168,7 +212,7 @@ class FOMCStatementModel(BaseDocument):
         return cls(
             doc_id=doc_id,
             source_url=source_url,
-            fetch_timestamp=datetime.utcnow(),
+            fetch_timestamp=fetch_timestamp or datetime.now(timezone.utc),
             raw_path=raw_path,
             content_type="text/html",
             doc_type=DocumentType.STATEMENT,
@@ -231,7 +275,14 @@ class SpeechModel(BaseDocument):
         return row
     
     @classmethod
-    def from_html(cls, html_content: str, doc_id: str, source_url: str, raw_path: str) -> "SpeechModel":
+    def from_html(
+        cls,
+        html_content: str,
+        doc_id: str,
+        source_url: str,
+        raw_path: str,
+        fetch_timestamp: Optional[datetime] = None,
+    ) -> "SpeechModel":
         """Create instance from HTML content.
         
         Args:
@@ -239,6 +290,7 @@ class SpeechModel(BaseDocument):
             doc_id: Document ID.
             source_url: Source URL.
             raw_path: Path to raw file.
+            fetch_timestamp: Fetch time shared by a batch. Defaults to now (UTC).
         
         Returns:
             Parsed SpeechModel instance.
@@ -250,7 +302,7 @@ class SpeechModel(BaseDocument):
         return cls(
             doc_id=doc_id,
             source_url=source_url,
-            fetch_timestamp=datetime.utcnow(),
+            fetch_timestamp=fetch_timestamp or datetime.now(timezone.utc),
             raw_path=raw_path,
             content_type="text/html",
             doc_type=DocumentType.SPEECH,
@@ -282,5 +334,50 @@ class PressConferenceModel(BaseDocument):
         return row
 
 
-# Type alias for any document model
-DocumentModel = BaseDocument | FOMCStatementModel | FOMCMinutesModel | SpeechModel | PressConferenceModel
+# Model tag for each doc_type that has a specialised model; other types
+# (reports) fall back to BaseDocument. Speeches and testimony share a model.
+_MODEL_TAGS = {
+    "statement": "statement",
+    "minutes": "minutes",
+    "speech": "speech",
+    "testimony": "speech",
+    "press_conference": "press_conference",
+}
+
+
+def _document_tag(value: Any) -> str:
+    """Pick the union member for raw metadata or a model instance by doc_type."""
+    if isinstance(value, dict):
+        doc_type = value.get("doc_type")
+    else:
+        doc_type = getattr(value, "doc_type", None)
+    return _MODEL_TAGS.get(getattr(doc_type, "value", doc_type), "base")
+
+
+# Type alias for any document model. The discriminator dispatches on
+# doc_type in one lookup instead of trying each member in turn.
+DocumentModel = Annotated[
+    Union[
+        Annotated[FOMCStatementModel, Tag("statement")],
+        Annotated[FOMCMinutesModel, Tag("minutes")],
+        Annotated[SpeechModel, Tag("speech")],
+        Annotated[PressConferenceModel, Tag("press_conference")],
+        Annotated[BaseDocument, Tag("base")],
+    ],
+    Discriminator(_document_tag),
+]
+
+_DOCUMENT_ADAPTER = TypeAdapter(DocumentModel)
+
+
+def parse_document_metadata(metadata: Dict[str, Any]) -> DocumentModel:
+    """Validate raw metadata into the model for its doc_type.
+    
+    Args:
+        metadata: Raw metadata dictionary, e.g. one record of a JSON
+            metadata file.
+    
+    Returns:
+        Validated instance of the matching document model.
+    """
+    return _DOCUMENT_ADAPTER.validate_python(metadata)
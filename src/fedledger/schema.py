@@ -4,10 +4,16 @@ This module defines and validates PyArrow schemas for document metadata
 to ensure consistency in Parquet storage.
 """
 
+import operator
+from functools import lru_cache
+
 import pyarrow as pa
-from typing import List, Dict, Any
+import pyarrow.compute as pc
+from typing import List, Dict, Any, FrozenSet, Optional, Tuple
 from datetime import datetime
 
+from fedledger.ids import validate_doc_id
+
 
 # Base schema for all documents
 BASE_DOCUMENT_SCHEMA = pa.schema([
@@ -99,10 +105,57 @@ VALID_DOC_TYPES = {
     "report",
 }
 
+_VALID_DOC_TYPES_ARRAY = pa.array(sorted(VALID_DOC_TYPES), type=pa.string())
+
+# Same format ids.validate_doc_id accepts, for column-wide checks
+_DOC_ID_PATTERN = "^[0-9a-f]{16}$"
+
+
+# Schema for each document type, built once at import
+_SCHEMA_BY_DOC_TYPE = {
+    "statement": FOMC_STATEMENT_SCHEMA,
+    "minutes": FOMC_MINUTES_SCHEMA,
+    "speech": SPEECH_SCHEMA,
+    "press_conference": PRESS_CONFERENCE_SCHEMA,
+    "testimony": SPEECH_SCHEMA,  # Same as speech
+    "report": BASE_DOCUMENT_SCHEMA,
+}
+
+# (required field names, nullable field names, all field names)
+_FieldNames = Tuple[FrozenSet[str], FrozenSet[str], FrozenSet[str]]
+
+# Per-schema field name sets, keyed by id(schema); each entry keeps its
+# schema alive so the id cannot be reused by another object
+_SCHEMA_META_CACHE: Dict[int, Tuple[pa.Schema, _FieldNames]] = {}
+
+
+def _schema_meta(schema: pa.Schema) -> _FieldNames:
+    """Return the field name sets of a schema, computed once per schema.
+    
+    Args:
+        schema: PyArrow schema.
+    
+    Returns:
+        Tuple of (required field names, nullable field names, all field names).
+    """
+    entry = _SCHEMA_META_CACHE.get(id(schema))
+    if entry is None or entry[0] is not schema:
+        names = (
+            frozenset(field.name for field in schema if not field.nullable),
+            frozenset(field.name for field in schema if field.nullable),
+            frozenset(schema.names),
+        )
+        entry = _SCHEMA_META_CACHE[id(schema)] = (schema, names)
+    return entry[1]
+
 
+@lru_cache(maxsize=16)
 def get_schema_for_doc_type(doc_type: str) -> pa.Schema:
     """Get the appropriate PyArrow schema for a document type.
     
+    Schemas are built once at import; results are memoized per spelling of
+    doc_type so repeated lookups skip normalization and validation.
+    
     Args:
         doc_type: Document type string.
     
@@ -120,16 +173,7 @@ def get_schema_for_doc_type(doc_type: str) -> pa.Schema:
             f"Must be one of: {', '.join(VALID_DOC_TYPES)}"
         )
     
-    schema_map = {
-        "statement": FOMC_STATEMENT_SCHEMA,
-        "minutes": FOMC_MINUTES_SCHEMA,
-        "speech": SPEECH_SCHEMA,
-        "press_conference": PRESS_CONFERENCE_SCHEMA,
-        "testimony": SPEECH_SCHEMA,  # Same as speech
-        "report": BASE_DOCUMENT_SCHEMA,
-    }
-    
-    return schema_map.get(doc_type, BASE_DOCUMENT_SCHEMA)
+    return _SCHEMA_BY_DOC_TYPE.get(doc_type, BASE_DOCUMENT_SCHEMA)
 
 
 def validate_row(row: Dict[str, Any], schema: pa.Schema) -> None:
@@ -143,47 +187,161 @@ def validate_row(row: Dict[str, Any], schema: pa.Schema) -> None:
         ValueError: If row doesn't match schema.
     """
     # Check required fields
-    for field in schema:
-        if not field.nullable and field.name not in row:
-            raise ValueError(f"Required field missing: {field.name}")
-        
-        if field.name in row and row[field.name] is not None:
-            # Check doc_type is valid
-            if field.name == "doc_type":
-                if row[field.name] not in VALID_DOC_TYPES:
-                    raise ValueError(
-                        f"Invalid doc_type: {row[field.name]}. "
-                        f"Must be one of: {', '.join(VALID_DOC_TYPES)}"
-                    )
-            
-            # Check doc_id format
-            if field.name == "doc_id":
-                doc_id = row[field.name]
-                if not isinstance(doc_id, str) or len(doc_id) != 16:
-                    raise ValueError(f"doc_id must be 16-character string, got: {doc_id}")
-                try:
-                    int(doc_id, 16)
-                except ValueError:
-                    raise ValueError(f"doc_id must be hexadecimal, got: {doc_id}")
-
-
-def validate_rows(rows: List[Dict[str, Any]], doc_type: str) -> None:
+    required, _, names = _schema_meta(schema)
+    missing = required - row.keys()
+    if missing:
+        # Report the first missing field in schema order
+        name = next(name for name in schema.names if name in missing)
+        raise ValueError(f"Required field missing: {name}")
+    
+    # Check doc_type is valid
+    doc_type = row.get("doc_type")
+    if doc_type is not None and "doc_type" in names:
+        if doc_type not in VALID_DOC_TYPES:
+            raise ValueError(
+                f"Invalid doc_type: {doc_type}. "
+                f"Must be one of: {', '.join(VALID_DOC_TYPES)}"
+            )
+    
+    # Check doc_id format
+    doc_id = row.get("doc_id")
+    if doc_id is not None and "doc_id" in names:
+        if not isinstance(doc_id, str) or len(doc_id) != 16:
+            raise ValueError(f"doc_id must be 16-character string, got: {doc_id}")
+        if not validate_doc_id(doc_id):
+            raise ValueError(f"doc_id must be hexadecimal, got: {doc_id}")
+
+
+def _row_error(
+    index: int,
+    row: Dict[str, Any],
+    schema: pa.Schema,
+) -> Optional[ValueError]:
+    """Validate a single row and describe the first problem found.
+    
+    Args:
+        index: Position of the row in the batch.
+        row: Row to validate.
+        schema: PyArrow schema to validate against.
+    
+    Returns:
+        ValueError for the row, or None if the row is valid.
+    """
+    try:
+        validate_row(row, schema)
+        pa.Table.from_pylist([row], schema=schema)
+    except (ValueError, pa.ArrowException) as e:
+        return ValueError(f"Row {index} validation failed: {e}")
+    return None
+
+
+def _invalid_rows_mask(
+    table: pa.Table,
+    names: FrozenSet[str],
+) -> Optional[pa.ChunkedArray]:
+    """Flag rows with an unknown doc_type or malformed doc_id.
+    
+    Args:
+        table: Table built from the rows.
+        names: Field names of the table's schema.
+    
+    Returns:
+        Boolean mask of invalid rows, or None if every row is valid.
+    """
+    mask = None
+    if "doc_type" in names:
+        doc_types = table.column("doc_type")
+        mask = pc.and_kleene(
+            pc.is_valid(doc_types),
+            pc.invert(pc.is_in(doc_types, value_set=_VALID_DOC_TYPES_ARRAY)),
+        )
+    if "doc_id" in names:
+        bad_ids = pc.invert(
+            pc.match_substring_regex(table.column("doc_id"), _DOC_ID_PATTERN)
+        )
+        mask = bad_ids if mask is None else pc.or_kleene(mask, bad_ids)
+    
+    if mask is None:
+        return None
+    mask = pc.fill_null(mask, False)
+    return mask if pc.any(mask).as_py() else None
+
+
+def _rows_to_table(rows: List[Dict[str, Any]], schema: pa.Schema) -> Optional[pa.Table]:
+    """Build a table column by column from rows that carry every field.
+    
+    Each column is sliced out with one itemgetter call per row and
+    converted with its declared type, so PyArrow does no type inference.
+    
+    Args:
+        rows: Row dictionaries.
+        schema: PyArrow schema of the table.
+    
+    Returns:
+        Table with the schema, or None if some row lacks a schema field.
+    
+    Raises:
+        pa.ArrowException: If a value does not match its column type.
+    """
+    try:
+        columns = list(zip(*map(operator.itemgetter(*schema.names), rows)))
+    except KeyError:
+        return None
+    
+    arrays = [
+        pa.array(column, type=field.type, from_pandas=False)
+        for column, field in zip(columns, schema)
+    ]
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def validate_rows(rows: List[Dict[str, Any]], doc_type: str) -> pa.Table:
     """Validate multiple rows against the appropriate schema.
     
+    Rows are converted to a table column by column with the schema's types,
+    which PyArrow checks in C++, and doc_id and doc_type are checked column-wide with
+    compute kernels. Rows are only re-checked one at a time to report the
+    first failure.
+    
     Args:
         rows: List of row dictionaries.
         doc_type: Document type for schema selection.
     
+    Returns:
+        Table of the rows with the document type's schema. Keys that are
+        not in the schema are dropped; missing nullable fields are null.
+    
     Raises:
         ValueError: If any row doesn't match schema.
     """
     schema = get_schema_for_doc_type(doc_type)
+    required, _, names = _schema_meta(schema)
+    
+    table = None
+    try:
+        # Rows from to_parquet_row() have every field of their schema;
+        # others are converted row-wise with missing nullable fields as null
+        if rows and len(schema) > 1:
+            table = _rows_to_table(rows, schema)
+        if table is None and all(required <= row.keys() for row in rows):
+            table = pa.Table.from_pylist(rows, schema=schema)
+    except pa.ArrowException:
+        pass
+    
+    if table is not None:
+        mask = _invalid_rows_mask(table, names)
+        if mask is None:
+            return table
+        candidates = [pc.index(mask, True).as_py()]
+    else:
+        candidates = range(len(rows))
     
-    for i, row in enumerate(rows):
-        try:
-            validate_row(row, schema)
-        except ValueError as e:
-            raise ValueError(f"Row {i} validation failed: {e}")
+    for i in candidates:
+        error = _row_error(i, rows[i], schema)
+        if error is not None:
+            raise error
+    
+    raise ValueError(f"Rows do not match the {doc_type} schema")
 
 
 def ensure_schema_compatibility(table: pa.Table, expected_schema: pa.Schema) -> pa.Table:
@@ -198,5 +356,20 @@ def ensure_schema_compatibility(table: pa.Table, expected_schema: pa.Schema) ->
     Returns:
         Table with schema matching expected_schema.
     """
-    # This is a simple version - could be extended with more sophisticated type coercion
-    return table.cast(expected_schema, safe=False)
+    # Tables built by validate_rows() already have the schema
+    if table.schema.equals(expected_schema, check_metadata=False):
+        return table
+    
+    if table.schema.names != expected_schema.names:
+        # This is a simple version - could be extended with more sophisticated
+        # type coercion
+        return table.cast(expected_schema, safe=False)
+    
+    # Cast only the columns whose type differs; the rest are reused as-is
+    columns = [
+        column
+        if column.type.equals(field.type)
+        else column.cast(field.type, safe=False)
+        for column, field in zip(table.columns, expected_schema)
+    ]
+    return pa.Table.from_arrays(columns, schema=expected_schema)
@@ -0,0 +1,61 @@
+"""Shared test fixtures.
+
+The suite can run under pytest-xdist (``pytest -n auto --dist=loadfile``).
+Session-scoped fixtures are then created once per worker, each in that
+worker's own tmp_path_factory directory, so they share no files.
+"""
+
+import pytest
+from pathlib import Path
+
+import fedledger.pipeline as pipeline_module
+from fedledger.config import FedLedgerConfig
+from fedledger.pipeline import Pipeline
+from fedledger.pydantic_models import DocumentType
+
+
+@pytest.fixture(scope="session")
+def fixtures_dir():
+    """Get fixtures directory."""
+    return Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture(scope="session")
+def fixture_bytes(fixtures_dir):
+    """Contents of each HTML fixture, read once per session."""
+    return {path: path.read_bytes() for path in fixtures_dir.glob("*.html")}
+
+
+@pytest.fixture(scope="session")
+def pipeline_artifacts(tmp_path_factory, fixtures_dir):
+    """Config and result of one pipeline run over two statement fixtures.
+
+    Shared by tests that only inspect the run's outputs; they must not
+    modify the data directory.
+    """
+    config = FedLedgerConfig(
+        data_dir=tmp_path_factory.mktemp("pipeline") / "data",
+        save_raw=False,
+        parallel=False,
+    )
+    config.ensure_directories()
+    result = Pipeline(config).run(
+        fixtures_dir, DocumentType.STATEMENT, "*.html", limit=2
+    )
+    return config, result
+
+
+@pytest.fixture
+def cached_fixture_reads(monkeypatch, fixture_bytes):
+    """Serve pipeline reads of fixture files from memory.
+
+    Other paths are still read from disk.
+    """
+    read_file_bytes = pipeline_module._read_file_bytes
+
+    def read_cached(path):
+        data = fixture_bytes.get(Path(path))
+        return read_file_bytes(path) if data is None else data
+
+    monkeypatch.setattr(pipeline_module, "_read_file_bytes", read_cached)
+    return fixture_bytes
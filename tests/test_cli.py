@@ -1,17 +1,11 @@
 """Test CLI commands."""
 
 import pytest
-from pathlib import Path
 import sys
 from io import StringIO
+import json
 
-from fedledger.cli import main
-
-
-@pytest.fixture
-def fixtures_dir():
-    """Get fixtures directory."""
-    return Path(__file__).parent / "fixtures"
+from fedledger.cli import main, setup_argparser, _fast_parse_args
 
 
 @pytest.fixture
@@ -22,6 +16,36 @@ def temp_data_dir(tmp_path):
     return data_dir
 
 
+@pytest.fixture
+def quiet_logging(monkeypatch):
+    """Log only errors from CLI runs whose output is not inspected."""
+    import fedledger.cli as cli
+    
+    setup_logging = cli.setup_logging
+    def setup_quiet_logging(level="INFO", **kwargs):
+        return setup_logging(level="ERROR", **kwargs)
+    
+    monkeypatch.setattr(cli, "setup_logging", setup_quiet_logging)
+
+
+@pytest.fixture(scope="session")
+def synced_data_dir(tmp_path_factory, fixtures_dir):
+    """Data directory with two statements synced once for read-only tests.
+    
+    Seeded through Pipeline directly; the sync command itself is covered by
+    the test_cli_sync_* tests.
+    """
+    from fedledger.config import FedLedgerConfig
+    from fedledger.pipeline import Pipeline
+    from fedledger.pydantic_models import DocumentType
+    
+    data_dir = tmp_path_factory.mktemp("synced") / "data"
+    pipeline = Pipeline(FedLedgerConfig(data_dir=data_dir, save_raw=False))
+    result = pipeline.run(fixtures_dir, DocumentType.STATEMENT, "*.html", limit=2)
+    assert result.success
+    return data_dir
+
+
 def test_cli_help():
     """Test CLI help command."""
     result = main([])
@@ -45,9 +69,10 @@ def test_cli_sync_dry_run(fixtures_dir, temp_data_dir, capsys):
     if processed_dir.exists():
         parquet_files = list(processed_dir.glob("*.parquet"))
         assert len(parquet_files) == 0
+    assert not (temp_data_dir / ".doc_id_scheme").exists()
 
 
-def test_cli_sync_basic(fixtures_dir, temp_data_dir):
+def test_cli_sync_basic(fixtures_dir, temp_data_dir, quiet_logging):
     """Test basic sync command."""
     result = main([
         "--data-dir", str(temp_data_dir),
@@ -72,9 +97,12 @@ def test_cli_sync_basic(fixtures_dir, temp_data_dir):
     
     json_files = list(metadata_dir.glob("*.json"))
     assert len(json_files) >= 1
+    
+    # --save-raw keeps a copy of each processed source file
+    assert len(list((temp_data_dir / "raw").glob("*.html"))) == 2
 
 
-def test_cli_sync_parallel(fixtures_dir, temp_data_dir):
+def test_cli_sync_parallel(fixtures_dir, temp_data_dir, quiet_logging):
     """Test sync with parallel processing."""
     result = main([
         "--data-dir", str(temp_data_dir),
@@ -89,20 +117,10 @@ def test_cli_sync_parallel(fixtures_dir, temp_data_dir):
     assert result == 0
 
 
-def test_cli_list(temp_data_dir, fixtures_dir):
+def test_cli_list(synced_data_dir):
     """Test list command after sync."""
-    # First sync some documents
-    main([
-        "--data-dir", str(temp_data_dir),
-        "sync",
-        str(fixtures_dir),
-        "--type", "statements",
-        "--limit", "1",
-    ])
-    
-    # Then list them
     result = main([
-        "--data-dir", str(temp_data_dir),
+        "--data-dir", str(synced_data_dir),
         "list",
         "--format", "table",
     ])
@@ -110,27 +128,17 @@ def test_cli_list(temp_data_dir, fixtures_dir):
     assert result == 0
 
 
-def test_cli_stats(temp_data_dir, fixtures_dir):
+def test_cli_stats(synced_data_dir):
     """Test stats command after sync."""
-    # First sync some documents
-    main([
-        "--data-dir", str(temp_data_dir),
-        "sync",
-        str(fixtures_dir),
-        "--type", "statements",
-        "--limit", "2",
-    ])
-    
-    # Then get stats
     result = main([
-        "--data-dir", str(temp_data_dir),
+        "--data-dir", str(synced_data_dir),
         "stats",
     ])
     
     assert result == 0
 
 
-def test_cli_verbose_mode(fixtures_dir, temp_data_dir):
+def test_cli_verbose_mode(fixtures_dir, temp_data_dir, capsys):
     """Test CLI with verbose flag."""
     result = main([
         "--data-dir", str(temp_data_dir),
@@ -142,6 +150,7 @@ def test_cli_verbose_mode(fixtures_dir, temp_data_dir):
     ])
     
     assert result == 0
+    assert "INFO" in capsys.readouterr().out
 
 
 def test_cli_invalid_command():
@@ -149,3 +158,136 @@ def test_cli_invalid_command():
     # argparse raises SystemExit, so we need to catch it
     with pytest.raises(SystemExit):
         main(["invalid_command"])
+
+
+@pytest.mark.parametrize("argv", [
+    ["sync", "tests/fixtures"],
+    ["--data-dir", "/tmp/x", "-v", "sync", "src", "--type", "minutes", "--limit", "3",
+     "--parallel", "--workers", "2", "--save-raw", "--dry-run", "--overwrite"],
+    ["--log-json", "list", "--format", "csv", "--type", "statement"],
+    ["info", "abc1234567890def"],
+    ["stats"],
+])
+def test_cli_fast_parser_matches_argparse(argv):
+    """Test the fast parser produces the same namespace as argparse."""
+    assert _fast_parse_args(argv) == setup_argparser().parse_args(argv)
+
+
+@pytest.mark.parametrize("argv", [
+    [],
+    ["--help"],
+    ["sync", "--help"],
+    ["sync", "src", "--type", "bogus"],
+    ["sync", "src", "--limit", "many"],
+    ["list", "--format=json"],
+    ["info"],
+    ["invalid_command"],
+])
+def test_cli_fast_parser_defers_to_argparse(argv):
+    """Test the fast parser falls back on anything it does not handle."""
+    assert _fast_parse_args(argv) is None
+
+
+def test_cli_info(synced_data_dir):
+    """Test info command after sync."""
+    metadata_file = synced_data_dir / "metadata" / "statement_metadata.json"
+    doc_id = json.loads(metadata_file.read_text())[0]["doc_id"]
+    
+    assert main(["--data-dir", str(synced_data_dir), "info", doc_id]) == 0
+    assert main(["--data-dir", str(synced_data_dir), "info", "ffffffffffffffff"]) == 1
+
+
+@pytest.mark.parametrize("fmt", ["json", "csv"])
+def test_cli_list_formats(synced_data_dir, capsys, fmt):
+    """Test list command machine-readable output formats."""
+    result = main([
+        "--data-dir", str(synced_data_dir),
+        "list",
+        "--format", fmt,
+    ])
+    
+    assert result == 0
+    out = capsys.readouterr().out
+    if fmt == "json":
+        records = json.loads(out)
+        assert len(records) == 2
+        assert all(len(r["doc_id"]) == 16 for r in records)
+    else:
+        lines = out.strip().splitlines()
+        assert len(lines) == 3
+        assert '"doc_id"' in lines[0]
+
+
+def test_cli_config_cached_and_not_mutated(temp_data_dir, fixtures_dir):
+    """Test the cached base config is reused and sync options stay off it."""
+    from fedledger.cli import _get_config
+    
+    _get_config.cache_clear()
+    main([
+        "--data-dir", str(temp_data_dir),
+        "sync",
+        str(fixtures_dir),
+        "--parallel",
+        "--workers", "2",
+        "--limit", "1",
+    ])
+    
+    config = _get_config(temp_data_dir, "INFO", False)
+    assert _get_config.cache_info().hits >= 1
+    assert config.parallel is False
+    assert config.max_workers == 4
+
+
+def test_cli_list_parallel_reads(temp_data_dir, fixtures_dir, monkeypatch, capsys):
+    """Test list output is the same with parallel Parquet reads."""
+    from fedledger.cli import _get_config
+    from fedledger.config import FedLedgerConfig
+    from fedledger.pipeline import Pipeline
+    from fedledger.pydantic_models import DocumentType
+    
+    pipeline = Pipeline(FedLedgerConfig(data_dir=temp_data_dir, save_raw=False))
+    pipeline.run(fixtures_dir, DocumentType.STATEMENT, "*.html")
+    pipeline.run(fixtures_dir, DocumentType.SPEECH, "*.html")
+    
+    capsys.readouterr()
+    
+    argv = ["--data-dir", str(temp_data_dir), "list", "--format", "json"]
+    _get_config.cache_clear()
+    assert main(argv) == 0
+    serial = capsys.readouterr().out
+    
+    monkeypatch.setenv("FEDLEDGER_PARALLEL", "true")
+    _get_config.cache_clear()
+    assert main(argv) == 0
+    _get_config.cache_clear()
+    
+    assert capsys.readouterr().out == serial
+
+
+def test_cli_static_help_matches_parser(monkeypatch, capsys):
+    """Test the pre-rendered help text is in sync with setup_argparser()."""
+    from fedledger.cli import _STATIC_HELP
+    
+    monkeypatch.setenv("COLUMNS", "80")
+    expected = setup_argparser().format_help()
+    # Python < 3.10 titles the options section differently
+    expected = expected.replace("optional arguments:", "options:")
+    assert _STATIC_HELP == expected
+    
+    assert main(["--help"]) == 0
+    assert capsys.readouterr().out == _STATIC_HELP
+
+
+def test_cli_list_json_without_orjson(synced_data_dir, monkeypatch, capsys):
+    """Test streamed JSON output is identical with the stdlib encoder."""
+    import fedledger.cli as cli
+    
+    argv = ["--data-dir", str(synced_data_dir), "list", "--format", "json"]
+    assert main(argv) == 0
+    default_out = capsys.readouterr().out
+    
+    monkeypatch.setattr(cli, "orjson", None)
+    assert main(argv) == 0
+    stdlib_out = capsys.readouterr().out
+    
+    assert json.loads(stdlib_out) == json.loads(default_out)
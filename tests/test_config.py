@@ -47,3 +47,16 @@ def test_config_ensure_directories(tmp_path):
     assert config.raw_dir.exists()
     assert config.processed_dir.exists()
     assert config.metadata_dir.exists()
+
+
+def test_config_ensure_directories_tracks_path_changes(tmp_path):
+    """Test repeated calls are cheap but still follow directory changes."""
+    config = FedLedgerConfig(data_dir=tmp_path / "test")
+    config.ensure_directories()
+    config.ensure_directories()
+    
+    config.cache_dir = tmp_path / "cache"
+    config.ensure_directories()
+    
+    assert config.cache_dir.exists()
+    assert config.raw_dir.exists()
@@ -0,0 +1,214 @@
+"""Test the HTTP session and downloads."""
+
+import io
+import os
+import socket
+
+import requests
+
+from fedledger.http import HTTPSession, download_to_file
+
+
+URL = "https://www.federalreserve.gov/statement.htm"
+
+
+def _response(body=b"<html>FOMC statement</html>"):
+    """Build a response as the network would return it.
+    
+    Pass body=None to leave the content unread for streaming.
+    """
+    response = requests.Response()
+    response.status_code = 200
+    response.reason = "OK"
+    response.headers["Content-Type"] = "text/html; charset=utf-8"
+    response.url = URL
+    if body is not None:
+        response._content = body
+    return response
+
+
+def test_cache_round_trip(tmp_path):
+    """Test a saved response is reconstructed from disk."""
+    with HTTPSession(cache_dir=tmp_path) as session:
+        session._save_to_cache(URL, _response())
+        cached = session._get_from_cache(URL)
+        
+        cache_path = session._get_cache_path(URL)
+        assert cache_path.parent.parent == tmp_path
+        assert cache_path.parent.name == cache_path.name[:2]
+    
+    assert cached.status_code == 200
+    assert cached.reason == "OK"
+    assert cached.url == URL
+    assert cached.content == b"<html>FOMC statement</html>"
+    assert cached.headers["content-type"] == "text/html; charset=utf-8"
+    assert cached.text == "<html>FOMC statement</html>"
+
+
+def test_cache_hit_skips_network(tmp_path, monkeypatch):
+    """Test get() serves cached responses without a request."""
+    with HTTPSession(cache_dir=tmp_path) as session:
+        session._save_to_cache(URL, _response())
+        
+        def fail(*args, **kwargs):
+            raise AssertionError("network request made on cache hit")
+        
+        monkeypatch.setattr(session.session, "get", fail)
+        assert session.get(URL).content == b"<html>FOMC statement</html>"
+
+
+def test_cache_concurrent_saves(tmp_path):
+    """Test threads caching the same URL leave one complete entry."""
+    from concurrent.futures import ThreadPoolExecutor
+    
+    bodies = [bytes([65 + i]) * 200_000 for i in range(8)]
+    with HTTPSession(cache_dir=tmp_path) as session:
+        def save(body):
+            session._save_to_cache(URL, _response(body))
+        
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(save, bodies))
+        
+        assert session._get_from_cache(URL).content in bodies
+        assert os.listdir(session._get_cache_path(URL).parent) == [
+            session._get_cache_path(URL).name
+        ]
+
+
+def test_cache_write_failure_still_returns_response(tmp_path, monkeypatch, caplog):
+    """Test get() returns fetched responses when the cache cannot be written."""
+    cache_dir = tmp_path / "cache"
+    with HTTPSession(cache_dir=cache_dir) as session:
+        # A file where the shard directory should go makes every write fail
+        cache_path = session._get_cache_path(URL)
+        cache_path.parent.write_bytes(b"")
+        monkeypatch.setattr(session.session, "get", lambda url, **kwargs: _response())
+        
+        with caplog.at_level("WARNING"):
+            response = session.get(URL)
+    
+    assert response.content == b"<html>FOMC statement</html>"
+    assert "Failed to cache" in caplog.text
+
+
+def test_cache_max_age_and_corrupt_entries(tmp_path):
+    """Test expired and corrupt entries are treated as misses."""
+    with HTTPSession(cache_dir=tmp_path, max_age=60) as session:
+        assert session._get_from_cache(URL) is None
+        
+        session._save_to_cache(URL, _response())
+        assert session._get_from_cache(URL) is not None
+        
+        session.max_age = -1
+        assert session._get_from_cache(URL) is None
+        
+        session.max_age = None
+        session._get_cache_path(URL).write_bytes(b"\x00\x01")
+        assert session._get_from_cache(URL) is None
+
+
+def test_connection_pool_configuration():
+    """Test pool sizes are passed through to the mounted adapters."""
+    with HTTPSession(pool_connections=4, pool_maxsize=16) as session:
+        adapter = session.session.get_adapter("https://www.federalreserve.gov/")
+        
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 16
+
+
+def test_download_to_file_streams(tmp_path, monkeypatch):
+    """Test downloads request a streamed response and write it to disk."""
+    calls = []
+    
+    def fake_get(url, **kwargs):
+        calls.append(kwargs)
+        response = _response(body=None)
+        response.raw = io.BytesIO(b"%PDF-1.7" * 10000)
+        return response
+    
+    with HTTPSession(cache_dir=tmp_path / "cache") as session:
+        monkeypatch.setattr(session.session, "get", fake_get)
+        result = download_to_file(URL, tmp_path / "out" / "doc.pdf", session=session)
+    
+    assert calls[0]["stream"] is True
+    assert result["status_code"] == 200
+    assert result["size_bytes"] == 80000
+    assert (tmp_path / "out" / "doc.pdf").read_bytes() == b"%PDF-1.7" * 10000
+    assert not any((tmp_path / "cache").iterdir())
+
+
+def test_download_to_file_from_cache(tmp_path, monkeypatch):
+    """Test cached responses without a raw stream are written from memory."""
+    with HTTPSession(cache_dir=tmp_path / "cache") as session:
+        session._save_to_cache(URL, _response())
+        monkeypatch.setattr(session.session, "get", None)
+        result = download_to_file(URL, tmp_path / "doc.html", session=session)
+    
+    assert result["size_bytes"] == len(b"<html>FOMC statement</html>")
+    assert (tmp_path / "doc.html").read_bytes() == b"<html>FOMC statement</html>"
+
+
+def test_default_sessions_share_adapter():
+    """Test default sessions reuse one adapter that survives close()."""
+    with HTTPSession() as first, HTTPSession() as second:
+        adapter = first.session.get_adapter(URL)
+        assert second.session.get_adapter(URL) is adapter
+    
+    with HTTPSession(max_retries=5) as custom:
+        assert custom.session.get_adapter(URL) is not adapter
+    
+    with HTTPSession() as third:
+        assert third.session.get_adapter(URL) is adapter
+    
+    assert HTTPSession.shared() is HTTPSession.shared()
+
+
+def test_adapters_set_socket_options():
+    """Test pooled connections disable Nagle and enable keep-alive."""
+    with HTTPSession() as default, HTTPSession(max_retries=5) as custom:
+        for session in (default, custom):
+            adapter = session.session.get_adapter(URL)
+            options = adapter.poolmanager.connection_pool_kw["socket_options"]
+            
+            assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in options
+            assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+
+
+def test_download_to_file_truncates_and_advises(tmp_path, monkeypatch):
+    """Test re-downloads replace old content and drop written pages."""
+    advised = []
+    monkeypatch.setattr(
+        os, "posix_fadvise", lambda *args: advised.append(args), raising=False
+    )
+    output_path = tmp_path / "doc.html"
+    output_path.write_bytes(b"x" * 100000)
+    
+    with HTTPSession(cache_dir=tmp_path / "cache") as session:
+        session._save_to_cache(URL, _response())
+        download_to_file(URL, output_path, session=session)
+    
+    assert output_path.read_bytes() == b"<html>FOMC statement</html>"
+    assert len(advised) == 1
+
+
+def test_cache_keyed_on_request_shape(tmp_path, monkeypatch):
+    """Test query params get separate entries and headers bypass the cache."""
+    calls = []
+    
+    def fake_get(url, params=None, **kwargs):
+        calls.append(params)
+        return _response(f"page {params['page']}".encode())
+    
+    with HTTPSession(cache_dir=tmp_path) as session:
+        monkeypatch.setattr(session.session, "get", fake_get)
+        
+        assert session.get(URL, params={"page": 1}).content == b"page 1"
+        assert session.get(URL, params={"page": 2}).content == b"page 2"
+        assert session.get(URL, params={"page": 1}).content == b"page 1"
+        assert len(calls) == 2
+        assert session._get_from_cache(URL) is None
+        
+        headers = {"Accept-Language": "es"}
+        response = session.get(URL, params={"page": 1}, headers=headers)
+        assert response.content == b"page 1"
+        assert len(calls) == 3
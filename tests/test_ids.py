@@ -0,0 +1,95 @@
+"""Test document ID generation."""
+
+import hashlib
+
+import pytest
+
+from fedledger.ids import (
+    doc_id_from_url,
+    generate_doc_id,
+    generate_doc_ids,
+    validate_doc_id,
+)
+
+
+URL = "https://www.federalreserve.gov/statement.htm"
+
+
+def test_generate_doc_id_blake2b():
+    """Test the default scheme is an 8-byte BLAKE2b digest."""
+    doc_id = generate_doc_id(URL, scheme="blake2b")
+    
+    assert doc_id == hashlib.blake2b(URL.encode("utf-8"), digest_size=8).hexdigest()
+    assert validate_doc_id(doc_id)
+
+
+def test_generate_doc_id_legacy_sha1():
+    """Test the legacy scheme reproduces sha1(source_url)[:16]."""
+    assert generate_doc_id(URL, scheme="sha1") == "dc11288aa80a47e9"
+
+
+def test_generate_doc_id_errors():
+    """Test empty URLs and unknown schemes are rejected."""
+    with pytest.raises(ValueError, match="source_url cannot be empty"):
+        generate_doc_id("")
+    with pytest.raises(ValueError, match="Unknown doc_id hash scheme"):
+        generate_doc_id(URL, scheme="md5")
+
+
+def test_doc_id_from_url_prefix():
+    """Test the optional prefix is prepended to the base ID."""
+    assert doc_id_from_url(URL, prefix="fomc_") == "fomc_" + generate_doc_id(URL)
+    assert doc_id_from_url(URL) == generate_doc_id(URL)
+
+
+def test_generate_doc_id_memoized():
+    """Test repeated calls for the same URL are served from the cache."""
+    generate_doc_id.cache_clear()
+    
+    first = generate_doc_id(URL)
+    second = generate_doc_id(URL)
+    
+    assert first == second
+    assert generate_doc_id.cache_info().hits == 1
+
+
+@pytest.mark.parametrize(
+    "doc_id, expected",
+    [
+        ("8a3f9c2e1b4d7a6c", True),
+        ("", False),
+        ("invalid", False),
+        ("8a3f9c2e1b4d7a6", False),
+        ("8a3f9c2e1b4d7a6c0", False),
+        ("8A3F9C2E1B4D7A6C", False),
+        ("0x8a3f9c2e1b4d7a", False),
+        ("8a3f_9c2e1b4d7a6", False),
+        ("8a3f9c2e1b4d7a6\n", False),
+        ("8a3f9c2e1b4d7a6é", False),
+    ],
+)
+def test_validate_doc_id(doc_id, expected):
+    """Test only 16 lowercase hex characters are accepted."""
+    assert validate_doc_id(doc_id) is expected
+
+
+@pytest.mark.parametrize("scheme", ["blake2b", "sha1"])
+def test_generate_doc_ids_matches_single(scheme):
+    """Test batch generation matches per-URL generation."""
+    urls = [URL, "https://example.com/doc", "https://example.com/ünïcode"]
+    
+    assert generate_doc_ids(urls, scheme=scheme) == [
+        generate_doc_id(url, scheme=scheme) for url in urls
+    ]
+    assert generate_doc_ids(iter([])) == []
+    with pytest.raises(ValueError, match="source_url cannot be empty"):
+        generate_doc_ids([URL, ""], scheme=scheme)
+
+
+def test_detect_hash_scheme():
+    """Test stored doc_ids are matched to the scheme that produced them."""
+    from fedledger.ids import detect_hash_scheme
+    
+    assert detect_hash_scheme(URL, generate_doc_id(URL, scheme="blake2b")) == "blake2b"
+    assert detect_hash_scheme(URL, "dc11288aa80a47e9") == "sha1"
+    assert detect_hash_scheme(URL, "0000000000000000") is None
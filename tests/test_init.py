@@ -8,24 +8,23 @@ def test_import_fedledger():
 
 
 def test_import_all_modules():
-    """Test that all modules can be imported."""
-    from fedledger import cli
-    from fedledger import config
-    from fedledger import ids
-    from fedledger import models
-    from fedledger import http
-    from fedledger import logging_config
-    from fedledger import pydantic_models
-    from fedledger import schema
-    from fedledger import pipeline
+    """Test that all modules can be imported.
+    
+    Runs in a fresh interpreter, so the result does not depend on what
+    other tests already imported and the session does not load modules
+    it otherwise would not.
+    """
+    import subprocess
+    import sys
+    
+    modules = [
+        "cli", "config", "ids", "models", "http", "logging_config",
+        "pydantic_models", "schema", "pipeline",
+    ]
+    code = "; ".join(f"import fedledger.{name}" for name in modules)
     
     # All imports should succeed
-    assert cli is not None
-    assert config is not None
-    assert ids is not None
-    assert models is not None
-    assert http is not None
-    assert logging_config is not None
-    assert pydantic_models is not None
-    assert schema is not None
-    assert pipeline is not None
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
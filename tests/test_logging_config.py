@@ -0,0 +1,122 @@
+"""Test structured and console log formatting."""
+
+import json
+import logging
+import sys
+from datetime import datetime, timezone
+
+from fedledger import logging_config
+from fedledger.logging_config import (
+    ColoredFormatter,
+    StructuredFormatter,
+    _format_timestamp,
+    get_logger,
+)
+
+
+def _record(**extra):
+    """Build a log record as logger.info(..., extra=extra) would."""
+    return logging.makeLogRecord({
+        "name": "fedledger.pipeline",
+        "levelname": "INFO",
+        "levelno": logging.INFO,
+        "msg": "Processed %d documents",
+        "args": (3,),
+        **extra,
+    })
+
+
+def test_structured_formatter_fields():
+    """Test context and extra fields are emitted, standard attributes are not."""
+    line = StructuredFormatter().format(
+        _record(
+            doc_id="1382332057c12eca", doc_type="statement", batch=7, extractor=None
+        )
+    )
+    data = json.loads(line)
+    
+    assert data["level"] == "INFO"
+    assert data["logger"] == "fedledger.pipeline"
+    assert data["message"] == "Processed 3 documents"
+    assert data["doc_id"] == "1382332057c12eca"
+    assert data["doc_type"] == "statement"
+    assert data["batch"] == 7
+    assert data["timestamp"].endswith("Z")
+    assert "lineno" not in data
+    assert "extractor" not in data
+
+
+def test_format_timestamp_matches_datetime():
+    """Test cached timestamps match datetime's ISO 8601 formatting."""
+    created = 1706709600.25
+    expected = datetime.fromtimestamp(created, timezone.utc).strftime(
+        "%Y-%m-%dT%H:%M:%S.%fZ"
+    )
+    
+    assert _format_timestamp(created) == expected
+    assert _format_timestamp(created + 0.5).startswith(expected[:20])
+    assert _format_timestamp(created + 86400).startswith("2024-02-01T14:00:00")
+
+
+def test_structured_formatter_without_orjson(monkeypatch):
+    """Test the stdlib encoder fallback produces the same record."""
+    record = _record(doc_id="1382332057c12eca", batch=7)
+    fast = json.loads(StructuredFormatter().format(record))
+    
+    monkeypatch.setattr(logging_config, "_dumps", json.dumps)
+    assert json.loads(StructuredFormatter().format(record)) == fast
+
+
+def test_colored_formatter_does_not_mutate_record():
+    """Test console formatting leaves the record intact for other handlers."""
+    record = _record(doc_id="1382332057c12eca", extractor=None)
+    line = ColoredFormatter("%(levelname)s - %(message)s").format(record)
+    
+    assert "\033[32mINFO\033[0m" in line
+    assert line.endswith("Processed 3 documents [doc_id=1382332057c12eca]")
+    assert record.levelname == "INFO"
+    assert record.msg == "Processed %d documents"
+    assert json.loads(StructuredFormatter().format(record))["level"] == "INFO"
+
+
+def test_logger_adapter_context():
+    """Test adapter context reaches both formatters via a single record field."""
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    logger = logging.getLogger("fedledger.test_adapter")
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    try:
+        adapter = get_logger("test_adapter", doc_id="1382332057c12eca", extractor=None)
+        adapter.info("Parsed", extra={"pages": 4})
+    finally:
+        logger.removeHandler(handler)
+    
+    record = records[0]
+    assert record._fedctx == {"doc_id": "1382332057c12eca"}
+    
+    data = json.loads(StructuredFormatter().format(record))
+    assert data["doc_id"] == "1382332057c12eca"
+    assert data["pages"] == 4
+    assert "_fedctx" not in data
+    assert "extractor" not in data
+    
+    line = ColoredFormatter("%(message)s").format(record)
+    assert line == "Parsed [doc_id=1382332057c12eca]"
+
+
+def test_structured_formatter_exception():
+    """Test tracebacks are emitted as one string cached on the record."""
+    try:
+        raise ValueError("bad statement")
+    except ValueError:
+        record = _record(exc_info=sys.exc_info())
+    
+    data = json.loads(StructuredFormatter().format(record))
+    
+    assert data["exception"]["type"] == "ValueError"
+    assert data["exception"]["message"] == "bad statement"
+    traceback = data["exception"]["traceback"]
+    assert traceback.startswith("Traceback (most recent call last)")
+    assert data["exception"]["traceback"] == record.exc_text
@@ -0,0 +1,79 @@
+"""Test the persistent doc_id metadata index."""
+
+import json
+import os
+
+from fedledger.metadata_index import INDEX_FILENAME, build_index, lookup_document
+
+
+def _write_metadata(path, docs):
+    """Write a metadata file in the pipeline's JSON layout."""
+    path.write_text(json.dumps(docs, indent=2), encoding="utf-8")
+
+
+def test_lookup_document(tmp_path):
+    """Test looking up documents across metadata files."""
+    _write_metadata(tmp_path / "statement_metadata.json", [
+        {"doc_id": "abc1234567890def", "title": "First"},
+        {"doc_id": "def1234567890abc", "title": "Second"},
+    ])
+    _write_metadata(tmp_path / "speech_metadata.json", [
+        {"doc_id": "0123456789abcdef", "title": "Speech — Chair"},
+    ])
+    
+    assert lookup_document(tmp_path, "def1234567890abc")["title"] == "Second"
+    assert lookup_document(tmp_path, "0123456789abcdef")["title"] == "Speech — Chair"
+    assert lookup_document(tmp_path, "ffffffffffffffff") is None
+    assert (tmp_path / INDEX_FILENAME).exists()
+
+
+def test_lookup_document_non_ascii_offsets(tmp_path):
+    """Test byte offsets stay correct when records contain non-ASCII text."""
+    docs = [
+        {"doc_id": "abc1234567890def", "title": "Política monetaria"},
+        {"doc_id": "def1234567890abc", "title": "Second"},
+    ]
+    (tmp_path / "speech_metadata.json").write_text(
+        json.dumps(docs, indent=2, ensure_ascii=False), encoding="utf-8"
+    )
+    
+    assert lookup_document(tmp_path, "abc1234567890def") == docs[0]
+    assert lookup_document(tmp_path, "def1234567890abc") == docs[1]
+
+
+def test_index_refreshes_changed_files(tmp_path):
+    """Test the index picks up rewritten and removed metadata files."""
+    metadata_file = tmp_path / "statement_metadata.json"
+    _write_metadata(metadata_file, [{"doc_id": "abc1234567890def", "title": "Old"}])
+    build_index(tmp_path)
+    
+    _write_metadata(metadata_file, [
+        {"doc_id": "1111111111111111", "title": "Padding"},
+        {"doc_id": "abc1234567890def", "title": "New"},
+    ])
+    stat = metadata_file.stat()
+    os.utime(metadata_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    
+    assert lookup_document(tmp_path, "abc1234567890def")["title"] == "New"
+    
+    metadata_file.unlink()
+    assert lookup_document(tmp_path, "abc1234567890def") is None
+
+
+def test_lookup_document_skips_malformed_files(tmp_path, caplog):
+    """Test malformed metadata files do not hide documents in valid ones."""
+    _write_metadata(tmp_path / "statement_metadata.json", [
+        {"doc_id": "abc1234567890def", "title": "Valid"},
+    ])
+    _write_metadata(tmp_path / "speech_metadata.json", {})
+    (tmp_path / "minutes_metadata.json").write_text('[{"doc_id": "def1234567890abc", ')
+    
+    with caplog.at_level("WARNING"):
+        assert lookup_document(tmp_path, "abc1234567890def")["title"] == "Valid"
+        assert lookup_document(tmp_path, "def1234567890abc") is None
+    assert "speech_metadata.json" in caplog.text
+    assert "minutes_metadata.json" in caplog.text
+    
+    # The direct scan used without an index skips them as well
+    from fedledger.metadata_index import _scan_for_document
+    assert _scan_for_document(tmp_path, "abc1234567890def")["title"] == "Valid"
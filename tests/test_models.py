@@ -0,0 +1,66 @@
+"""Test the shared dataclass models."""
+
+import dataclasses
+import sys
+from datetime import datetime
+
+import pytest
+
+from fedledger.models import Document, FetchResult, FOMCStatement
+
+
+def _statement(**overrides):
+    """Build a valid FOMCStatement."""
+    fields = {
+        "doc_id": "1382332057c12eca",
+        "source_url": "https://www.federalreserve.gov/statement.htm",
+        "fetch_timestamp": datetime(2024, 1, 31, 14, 0),
+        "raw_path": "data/raw/statement/1382332057c12eca.html",
+        "content_type": "text/html",
+    }
+    fields.update(overrides)
+    return FOMCStatement(**fields)
+
+
+def test_models_are_frozen():
+    """Test instances reject attribute assignment and compare by value."""
+    stmt = _statement()
+    
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        stmt.title = "Changed"
+    
+    assert stmt == _statement()
+    assert isinstance(stmt, Document)
+    
+    result = FetchResult(success=True, doc_id=stmt.doc_id, source_url=stmt.source_url)
+    assert hash(result) == hash(dataclasses.replace(result))
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+def test_models_use_slots():
+    """Test instances carry no per-instance __dict__."""
+    assert not hasattr(_statement(), "__dict__")
+
+
+def test_document_validation():
+    """Test __post_init__ validation still runs on frozen instances."""
+    with pytest.raises(ValueError, match="doc_id must be 16 characters"):
+        _statement(doc_id="short")
+    with pytest.raises(ValueError, match="raw_path is required"):
+        _statement(raw_path="")
+
+
+def test_metadata_shared_until_set():
+    """Test empty metadata is shared and promoted to a dict on first write."""
+    stmt = _statement()
+    other = _statement()
+    
+    assert stmt.metadata is other.metadata
+    with pytest.raises(TypeError):
+        stmt.metadata["vote"] = "10-0"
+    
+    stmt.set_metadata("vote", "10-0")
+    
+    assert stmt.metadata == {"vote": "10-0"}
+    assert isinstance(stmt.metadata, dict)
+    assert other.metadata == {}
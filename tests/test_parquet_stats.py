@@ -0,0 +1,64 @@
+"""Test the Parquet stats sidecar."""
+
+import json
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from fedledger.parquet_stats import (
+    STATS_FILENAME,
+    collect_parquet_stats,
+    record_parquet_stats,
+    scan_parquet_files,
+)
+
+
+def _write(path, num_rows):
+    """Write a small Parquet file with the given number of rows."""
+    pq.write_table(pa.table({"doc_id": [f"{i:016x}" for i in range(num_rows)]}), path)
+
+
+def test_record_and_collect(tmp_path):
+    """Test recorded entries are returned without reading footers."""
+    path = tmp_path / "statement_documents.parquet"
+    _write(path, 3)
+    record_parquet_stats(path, 3)
+    
+    sidecar = json.loads((tmp_path / STATS_FILENAME).read_text())
+    assert sidecar["statement_documents.parquet"]["num_rows"] == 3
+    
+    stats = collect_parquet_stats(tmp_path)
+    assert stats["statement_documents.parquet"]["num_rows"] == 3
+    assert stats["statement_documents.parquet"]["size"] == path.stat().st_size
+
+
+def test_collect_refreshes_stale_entries(tmp_path):
+    """Test changed, new and removed files are reconciled with the sidecar."""
+    stale = tmp_path / "statement_documents.parquet"
+    removed = tmp_path / "minutes_documents.parquet"
+    _write(stale, 1)
+    _write(removed, 1)
+    record_parquet_stats(stale, 1)
+    record_parquet_stats(removed, 1)
+    
+    _write(stale, 5)
+    removed.unlink()
+    _write(tmp_path / "speech_documents.parquet", 2)
+    
+    stats = collect_parquet_stats(tmp_path)
+    assert {name: s["num_rows"] for name, s in stats.items()} == {
+        "speech_documents.parquet": 2,
+        "statement_documents.parquet": 5,
+    }
+    assert json.loads((tmp_path / STATS_FILENAME).read_text()) == stats
+
+
+def test_scan_parquet_files(tmp_path):
+    """Test scanning ignores non-Parquet and hidden files."""
+    _write(tmp_path / "b.parquet", 1)
+    _write(tmp_path / "a.parquet", 1)
+    (tmp_path / ".hidden.parquet").write_bytes(b"")
+    (tmp_path / STATS_FILENAME).write_text("{}")
+    
+    assert [e.name for e in scan_parquet_files(tmp_path)] == ["a.parquet", "b.parquet"]
+    assert scan_parquet_files(tmp_path / "missing") == []
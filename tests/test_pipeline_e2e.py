@@ -7,42 +7,48 @@ import pyarrow.parquet as pq
 
 from fedledger.config import FedLedgerConfig
 from fedledger.pipeline import Pipeline
-from fedledger.pydantic_models import DocumentType
+from fedledger.pydantic_models import DocumentType, FOMCStatementModel
 from fedledger.ids import generate_doc_id
-
-
-@pytest.fixture
-def fixtures_dir():
-    """Get fixtures directory."""
-    return Path(__file__).parent / "fixtures"
+from fedledger.schema import get_schema_for_doc_type
 
 
 @pytest.fixture
 def temp_config(tmp_path):
-    """Create temporary configuration."""
+    """Create temporary configuration (raw files are not saved)."""
     config = FedLedgerConfig(
         data_dir=tmp_path / "data",
-        save_raw=True,
+        save_raw=False,
         parallel=False,
     )
     config.ensure_directories()
     return config
 
 
-def test_pipeline_discovery(fixtures_dir, temp_config):
-    """Test document discovery."""
+@pytest.fixture
+def pipeline(temp_config):
+    """Pipeline over temp_config, closed after the test."""
     pipeline = Pipeline(temp_config)
-    
+    yield pipeline
+    pipeline.close()
+
+
+@pytest.fixture
+def temp_config_with_raw(temp_config):
+    """Create temporary configuration that saves raw files."""
+    temp_config.save_raw = True
+    return temp_config
+
+
+def test_pipeline_discovery(fixtures_dir, pipeline):
+    """Test document discovery."""
     files = pipeline.discover_local_files(fixtures_dir, "*.html")
     
     assert len(files) >= 3
     assert all(f.suffix == ".html" for f in files)
 
 
-def test_pipeline_process_single_document(fixtures_dir, temp_config):
+def test_pipeline_process_single_document(fixtures_dir, pipeline):
     """Test processing a single document."""
-    pipeline = Pipeline(temp_config)
-    
     statement_file = fixtures_dir / "statement_20240131.html"
     assert statement_file.exists()
     
@@ -58,13 +64,11 @@ def test_pipeline_process_single_document(fixtures_dir, temp_config):
     assert doc.raw_path is not None
 
 
-def test_pipeline_process_parallel(fixtures_dir, temp_config):
+def test_pipeline_process_parallel(fixtures_dir, temp_config, pipeline):
     """Test parallel document processing."""
     temp_config.parallel = True
     temp_config.max_workers = 2
     
-    pipeline = Pipeline(temp_config)
-    
     files = pipeline.discover_local_files(fixtures_dir, "*.html")
     documents = pipeline.process_documents_parallel(files, DocumentType.STATEMENT)
     
@@ -72,55 +76,84 @@ def test_pipeline_process_parallel(fixtures_dir, temp_config):
     assert all(doc.doc_id for doc in documents)
 
 
-def test_pipeline_write_parquet(fixtures_dir, temp_config):
-    """Test writing documents to Parquet."""
-    pipeline = Pipeline(temp_config)
-    
+def test_pipeline_process_parallel_processes(
+    fixtures_dir, temp_config, pipeline, cached_fixture_reads
+):
+    """Test process-pool processing matches sequential processing."""
     files = pipeline.discover_local_files(fixtures_dir, "*.html")
-    documents = pipeline.process_documents_parallel(files[:1], DocumentType.STATEMENT)
+    sequential = pipeline.process_documents_parallel(files, DocumentType.STATEMENT)
     
-    output_path = temp_config.processed_dir / "test_documents.parquet"
-    pipeline.write_parquet(documents, output_path, DocumentType.STATEMENT)
+    temp_config.parallel = True
+    temp_config.max_workers = 2
+    temp_config.executor_kind = "process"
+    pipeline.register_extractor(DocumentType.STATEMENT, FOMCStatementModel.from_html)
+    assert pipeline._use_process_pool()
     
-    assert output_path.exists()
+    documents = pipeline.process_documents_parallel(files, DocumentType.STATEMENT)
+    
+    assert sorted(d.doc_id for d in documents) == sorted(d.doc_id for d in sequential)
+    assert all(isinstance(d, FOMCStatementModel) for d in documents)
     
-    # Verify Parquet file can be read
-    table = pq.read_table(output_path)
-    assert len(table) == len(documents)
-    assert "doc_id" in table.column_names
-    assert "source_url" in table.column_names
+    # Extractors that cannot be pickled fall back to threads
+    pipeline.register_extractor(
+        DocumentType.STATEMENT, lambda *args: FOMCStatementModel.from_html(*args)
+    )
+    assert not pipeline._use_process_pool()
+    documents = pipeline.process_documents_parallel(files, DocumentType.STATEMENT)
+    assert len(documents) == len(files)
 
 
-def test_pipeline_write_json_metadata(fixtures_dir, temp_config):
-    """Test writing JSON metadata."""
-    pipeline = Pipeline(temp_config)
+def test_pipeline_write_parquet(pipeline_artifacts):
+    """Test writing documents to Parquet."""
+    config, result = pipeline_artifacts
     
-    files = pipeline.discover_local_files(fixtures_dir, "*.html")
-    documents = pipeline.process_documents_parallel(files[:1], DocumentType.STATEMENT)
+    output_path = config.processed_dir / "statement_documents.parquet"
+    assert output_path.exists()
     
-    output_path = temp_config.metadata_dir / "test_metadata.json"
-    pipeline.write_json_metadata(documents, output_path)
+    # Verify the Parquet footer can be read
+    metadata = pq.read_metadata(output_path)
+    assert metadata.num_rows == result.documents_processed
+    assert "doc_id" in metadata.schema.names
+    assert "source_url" in metadata.schema.names
+
+
+def test_pipeline_write_json_metadata(pipeline_artifacts):
+    """Test writing JSON metadata."""
+    config, result = pipeline_artifacts
     
+    output_path = config.metadata_dir / "statement_metadata.json"
     assert output_path.exists()
     
     # Verify JSON can be read
     with open(output_path, "r") as f:
         metadata = json.load(f)
     
-    assert len(metadata) == len(documents)
+    assert len(metadata) == result.documents_processed
     assert metadata[0]["doc_id"]
 
 
-def test_pipeline_full_run(fixtures_dir, temp_config):
-    """Test complete pipeline execution."""
-    pipeline = Pipeline(temp_config)
+def test_pipeline_write_json_metadata_without_orjson(
+    fixtures_dir, temp_config, pipeline, monkeypatch
+):
+    """Test the stdlib fallback writes the same metadata as orjson."""
+    import fedledger.pipeline as pipeline_module
     
-    result = pipeline.run(
-        source_directory=fixtures_dir,
-        doc_type=DocumentType.STATEMENT,
-        pattern="*.html",
-        limit=2,
-    )
+    files = pipeline.discover_local_files(fixtures_dir, "*.html")
+    documents = pipeline.process_documents_parallel(files[:2], DocumentType.STATEMENT)
+    
+    fast_path = temp_config.metadata_dir / "fast_metadata.json"
+    pipeline.write_json_metadata(documents, fast_path)
+    
+    monkeypatch.setattr(pipeline_module, "orjson", None)
+    slow_path = temp_config.metadata_dir / "slow_metadata.json"
+    pipeline.write_json_metadata(documents, slow_path)
+    
+    assert json.loads(fast_path.read_text()) == json.loads(slow_path.read_text())
+
+
+def test_pipeline_full_run(pipeline_artifacts):
+    """Test complete pipeline execution."""
+    _, result = pipeline_artifacts
     
     assert result.success
     assert result.documents_processed >= 1
@@ -131,10 +164,8 @@ def test_pipeline_full_run(fixtures_dir, temp_config):
         assert output_file.exists()
 
 
-def test_pipeline_deterministic_doc_ids(fixtures_dir, temp_config):
+def test_pipeline_deterministic_doc_ids(fixtures_dir, pipeline):
     """Test that doc_id generation is stable and deterministic."""
-    pipeline = Pipeline(temp_config)
-    
     statement_file = fixtures_dir / "statement_20240131.html"
     source_url = "https://www.federalreserve.gov/statement.htm"
     
@@ -147,30 +178,357 @@ def test_pipeline_deterministic_doc_ids(fixtures_dir, temp_config):
     assert len(doc1.doc_id) == 16
 
 
-def test_pipeline_schema_validation(fixtures_dir, temp_config):
+def test_pipeline_schema_validation(pipeline_artifacts):
     """Test that output schema is validated correctly."""
-    pipeline = Pipeline(temp_config)
-    
-    result = pipeline.run(
-        source_directory=fixtures_dir,
-        doc_type=DocumentType.STATEMENT,
-        pattern="statement_*.html",
-        limit=1,
-    )
+    config, result = pipeline_artifacts
     
     assert result.success
     
     # Read Parquet and verify schema
-    parquet_file = temp_config.processed_dir / "statement_documents.parquet"
-    table = pq.read_table(parquet_file)
+    parquet_file = config.processed_dir / "statement_documents.parquet"
+    schema = pq.read_schema(parquet_file)
     
     # Check required fields
     required_fields = ["doc_id", "source_url", "fetch_timestamp", "raw_path", "content_type", "doc_type"]
     for field in required_fields:
-        assert field in table.column_names
+        assert field in schema.names
     
     # Check doc_id format
-    df = table.to_pandas()
-    for doc_id in df["doc_id"]:
+    doc_ids = pq.read_table(parquet_file, columns=["doc_id"]).column("doc_id")
+    for doc_id in doc_ids.to_pylist():
         assert len(doc_id) == 16
         int(doc_id, 16)  # Should be valid hex
+
+
+def test_pipeline_discovery_iter(fixtures_dir, pipeline):
+    """Test lazy discovery matches eager discovery."""
+    entries = list(pipeline.discover_local_files_iter(fixtures_dir, "*.html"))
+    files = pipeline.discover_local_files(fixtures_dir, "*.html")
+    
+    assert sorted(e.name for e in entries) == sorted(f.name for f in files)
+    assert all(e.stat().st_size > 0 for e in entries)
+    assert list(pipeline.discover_local_files_iter(fixtures_dir / "missing")) == []
+
+
+def test_pipeline_discovery_matches_glob(tmp_path, pipeline):
+    """Test scandir discovery matches Path.glob for flat and recursive patterns."""
+    (tmp_path / "nested" / "deeper").mkdir(parents=True)
+    for name in ["a.html", "b.pdf", "nested/c.html", "nested/deeper/d.html"]:
+        (tmp_path / name).write_text("<html></html>")
+    (tmp_path / "dir.html").mkdir()
+    for pattern in [
+        "*.html", "**/*.html", "nested/*.html", "nested/**/*.html",
+        "nested/deeper/*.html", "missing/*.html", "*/*.html",
+    ]:
+        files = pipeline.discover_local_files(tmp_path, pattern)
+        expected = [f for f in tmp_path.glob(pattern) if f.is_file()]
+        assert sorted(files) == sorted(expected)
+    
+    assert len(pipeline.discover_local_files(tmp_path, "**/*.html")) == 3
+
+
+def test_pipeline_write_parquet_uses_schema_types(fixtures_dir, temp_config, pipeline):
+    """Test all-null optional columns keep their schema types."""
+    files = pipeline.discover_local_files(fixtures_dir, "*.html")
+    documents = pipeline.process_documents_parallel(files[:2], DocumentType.STATEMENT)
+    
+    output_path = temp_config.processed_dir / "typed_documents.parquet"
+    pipeline.write_parquet(documents, output_path, DocumentType.STATEMENT)
+    
+    schema = pq.read_schema(output_path)
+    expected = get_schema_for_doc_type("statement")
+    assert schema.names == expected.names
+    assert [f.type for f in schema] == [f.type for f in expected]
+
+
+def test_pipeline_write_parquet_buffered(fixtures_dir, temp_config):
+    """Test writes inside a with block append row groups to one file."""
+    files = Pipeline(temp_config).discover_local_files(fixtures_dir, "*.html")
+    output_path = temp_config.processed_dir / "buffered_documents.parquet"
+    
+    with Pipeline(temp_config) as pipeline:
+        documents = pipeline.process_documents_parallel(
+            files[:2], DocumentType.STATEMENT
+        )
+        pipeline.write_parquet(documents[:1], output_path, DocumentType.STATEMENT)
+        pipeline.write_parquet(documents[1:], output_path, DocumentType.STATEMENT)
+    
+    metadata = pq.read_metadata(output_path)
+    assert metadata.num_rows == 2
+    assert metadata.num_row_groups == 2
+    assert metadata.row_group(0).column(0).compression == "ZSTD"
+    
+    stats = json.loads((temp_config.processed_dir / "_stats.json").read_text())
+    assert stats["buffered_documents.parquet"]["num_rows"] == 2
+
+
+def test_pipeline_write_parquet_failure(fixtures_dir, temp_config, monkeypatch):
+    """Test a failed write leaves neither a partial file nor a stats entry."""
+    files = Pipeline(temp_config).discover_local_files(fixtures_dir, "*.html")
+    output_path = temp_config.processed_dir / "failed_documents.parquet"
+    stats_path = temp_config.processed_dir / "_stats.json"
+    
+    def failing_write(self, table, row_group_size=None):
+        raise OSError("disk full")
+    
+    # A completed earlier write is recorded, then overwritten by a failed one
+    pipeline = Pipeline(temp_config)
+    documents = pipeline.process_documents_parallel(files[:2], DocumentType.STATEMENT)
+    pipeline.write_parquet(documents, output_path, DocumentType.STATEMENT)
+    assert "failed_documents.parquet" in json.loads(stats_path.read_text())
+    
+    monkeypatch.setattr(pq.ParquetWriter, "write_table", failing_write)
+    with pytest.raises(OSError, match="disk full"):
+        pipeline.write_parquet(documents, output_path, DocumentType.STATEMENT)
+    assert not output_path.exists()
+    assert "failed_documents.parquet" not in json.loads(stats_path.read_text())
+    
+    # Inside a with block the writer is dropped, so the block still closes
+    with pytest.raises(OSError, match="disk full"):
+        with Pipeline(temp_config) as buffered:
+            buffered.write_parquet(documents, output_path, DocumentType.STATEMENT)
+    assert not output_path.exists()
+    assert buffered._writers == {}
+
+
+def test_pipeline_write_parquet_layout_config(fixtures_dir, temp_config, pipeline):
+    """Test row-group size and page size come from the config."""
+    temp_config.parquet_row_group_size = 1
+    temp_config.parquet_page_size = 64 * 1024
+    files = pipeline.discover_local_files(fixtures_dir, "*.html")
+    documents = pipeline.process_documents_parallel(files[:3], DocumentType.STATEMENT)
+    output_path = temp_config.processed_dir / "layout_documents.parquet"
+    pipeline.write_parquet(documents, output_path, DocumentType.STATEMENT)
+    
+    metadata = pq.read_metadata(output_path)
+    assert metadata.num_row_groups == 3
+    assert metadata.format_version == "2.6"
+    assert metadata.row_group(0).column(0).is_stats_set
+
+
+def test_pipeline_raw_files_saved_as_bytes(tmp_path, temp_config_with_raw):
+    """Test raw copies are byte-exact and PDF extractors receive bytes."""
+    pdf_data = b"%PDF-1.4\n\xff\xfe binary \x00 payload"
+    (tmp_path / "report.pdf").write_bytes(pdf_data)
+    (tmp_path / "page.html").write_bytes("<html>café</html>".encode("utf-8"))
+    
+    received = {}
+    
+    def extractor(content, doc_id, url, raw_path):
+        received[Path(url).suffix] = content
+        return FOMCStatementModel.from_html("", doc_id, url, raw_path)
+    
+    pipeline = Pipeline(temp_config_with_raw)
+    pipeline.register_extractor(DocumentType.STATEMENT, extractor)
+    for name in ["report.pdf", "page.html"]:
+        doc = pipeline.process_document(tmp_path / name, DocumentType.STATEMENT)
+        assert pipeline.flush_raw_writes() == set()
+        assert Path(doc.raw_path).read_bytes() == (tmp_path / name).read_bytes()
+    
+    assert received[".pdf"] == pdf_data
+    assert received[".html"] == "<html>café</html>"
+
+
+def test_pipeline_raw_write_failures(fixtures_dir, temp_config_with_raw, monkeypatch):
+    """Test documents whose background raw write fails are dropped."""
+    import fedledger.pipeline as pipeline_module
+    
+    pipeline = Pipeline(temp_config_with_raw)
+    files = pipeline.discover_local_files(fixtures_dir, "*.html")
+    
+    def failing_copy(source_path, raw_path):
+        raise OSError("disk full")
+    
+    monkeypatch.setattr(pipeline_module, "_save_raw_copy", failing_copy)
+    assert pipeline.process_documents_parallel(files[:2], DocumentType.STATEMENT) == []
+    monkeypatch.undo()
+    
+    # Failed paths are retried on the next pass
+    documents = pipeline.process_documents_parallel(files[:2], DocumentType.STATEMENT)
+    assert len(documents) == 2
+    assert all(Path(doc.raw_path).exists() for doc in documents)
+
+
+def test_pipeline_batch_doc_ids_and_log_context(fixtures_dir, pipeline, caplog):
+    """Test batched doc_ids match per-file ids and logs carry the context."""
+    files = pipeline.discover_local_files(fixtures_dir, "*.html")
+    
+    with caplog.at_level("INFO", logger="fedledger"):
+        documents = pipeline.process_documents_parallel(files, DocumentType.STATEMENT)
+    
+    expected = {generate_doc_id(f"file://{path}") for path in files}
+    assert {doc.doc_id for doc in documents} == expected
+    
+    logged = {r.doc_id for r in caplog.records if hasattr(r, "doc_id")}
+    assert logged == expected
+    assert all(
+        r.doc_type == "statement" for r in caplog.records if hasattr(r, "doc_id")
+    )
+
+
+def test_pipeline_batch_fetch_timestamp(fixtures_dir, pipeline):
+    """Test documents in a batch share one timezone-aware fetch timestamp."""
+    from datetime import datetime, timezone
+    
+    files = pipeline.discover_local_files(fixtures_dir, "*.html")
+    
+    documents = pipeline.process_documents_parallel(files, DocumentType.STATEMENT)
+    assert len({doc.fetch_timestamp for doc in documents}) == 1
+    assert documents[0].fetch_timestamp.tzinfo is not None
+    
+    batch_ts = datetime(2024, 1, 31, 14, 0, tzinfo=timezone.utc)
+    documents = pipeline.process_documents_parallel(
+        files, DocumentType.STATEMENT, fetch_timestamp=batch_ts
+    )
+    assert all(doc.fetch_timestamp == batch_ts for doc in documents)
+
+
+def test_pipeline_raw_files_independent_of_sources(tmp_path, temp_config_with_raw):
+    """Test raw copies survive in-place source edits and never touch sources."""
+    import os
+    
+    first = tmp_path / "first.html"
+    second = tmp_path / "second.html"
+    first.write_text("<html>first</html>")
+    second.write_text("<html>second</html>")
+    
+    temp_config_with_raw.overwrite = True
+    pipeline = Pipeline(temp_config_with_raw)
+    url = "https://www.federalreserve.gov/statement.htm"
+    
+    doc = pipeline.process_document(first, DocumentType.STATEMENT, source_url=url)
+    pipeline.flush_raw_writes()
+    raw_path = Path(doc.raw_path)
+    assert not os.path.samefile(raw_path, first)
+    
+    # Rewriting the source in place (as a re-download does) keeps the copy
+    with open(first, "r+") as f:
+        f.write("<html>FIRST</html>")
+    assert raw_path.read_text() == "<html>first</html>"
+    
+    # Re-saving the same URL from another file replaces the copy
+    pipeline.process_document(second, DocumentType.STATEMENT, source_url=url)
+    assert pipeline.flush_raw_writes() == set()
+    assert raw_path.read_text() == "<html>second</html>"
+    assert first.read_text() == "<html>FIRST</html>"
+    
+    # Reprocessing the raw file itself is a no-op copy
+    pipeline.process_document(raw_path, DocumentType.STATEMENT, source_url=url)
+    assert pipeline.flush_raw_writes() == set()
+    assert raw_path.read_text() == "<html>second</html>"
+    assert not list(temp_config_with_raw.raw_dir.glob(".*.tmp"))
+
+
+def test_pipeline_extractor_receives_fixture_text(
+    fixtures_dir, pipeline, cached_fixture_reads
+):
+    """Test HTML extractors receive the decoded file contents."""
+    received = []
+    
+    def extractor(content, doc_id, url, raw_path):
+        received.append(content)
+        return FOMCStatementModel.from_html(content, doc_id, url, raw_path)
+    
+    pipeline.register_extractor(DocumentType.STATEMENT, extractor)
+    files = pipeline.discover_local_files(fixtures_dir, "*.html")
+    pipeline.process_documents_parallel(files, DocumentType.STATEMENT)
+    
+    expected = [data.decode("utf-8") for data in cached_fixture_reads.values()]
+    assert sorted(received) == sorted(expected)
+
+
+def test_pipeline_raw_writer_started_on_demand(fixtures_dir, temp_config_with_raw):
+    """Test writer threads start with the first raw write and stop on close."""
+    pipeline = Pipeline(temp_config_with_raw)
+    assert pipeline._raw_write_pool is None
+    
+    statement_file = fixtures_dir / "statement_20240131.html"
+    doc = pipeline.process_document(statement_file, DocumentType.STATEMENT)
+    assert pipeline._raw_write_pool is not None
+    
+    pipeline.close()
+    assert pipeline._raw_write_pool is None
+    assert Path(doc.raw_path).exists()
+
+
+def test_pipeline_legacy_sha1_ledger_keeps_sha1_ids(fixtures_dir, temp_config):
+    """Test a ledger written with SHA-1 IDs keeps producing SHA-1 IDs."""
+    from fedledger.ids import HASH_SCHEME_FILE
+    
+    statement_file = fixtures_dir / "statement_20240131.html"
+    url = "https://www.federalreserve.gov/statement.htm"
+    legacy_id = generate_doc_id(url, scheme="sha1")
+    (temp_config.metadata_dir / "statement_metadata.json").write_text(
+        json.dumps([{"doc_id": legacy_id, "source_url": url}])
+    )
+    
+    pipeline = Pipeline(temp_config)
+    doc = pipeline.process_document(
+        statement_file, DocumentType.STATEMENT, source_url=url
+    )
+    
+    assert pipeline.hash_scheme == "sha1"
+    assert doc.doc_id == legacy_id
+    assert (temp_config.data_dir / HASH_SCHEME_FILE).read_text().strip() == "sha1"
+    
+    # The recorded scheme wins once the inferring files are gone
+    (temp_config.metadata_dir / "statement_metadata.json").unlink()
+    assert Pipeline(temp_config).hash_scheme == "sha1"
+
+
+@pytest.mark.parametrize(
+    "existing_file, legacy",
+    [
+        (None, False),
+        ("raw/README.md", False),
+        ("processed/notes.txt", False),
+        ("raw/dc11288aa80a47e9.html", True),
+        ("processed/statement_documents.parquet", True),
+    ],
+)
+def test_pipeline_hash_scheme_for_unmarked_ledgers(tmp_path, existing_file, legacy):
+    """Test only pipeline output marks an unmarked ledger as SHA-1."""
+    from fedledger.ids import HASH_SCHEME
+    
+    config = FedLedgerConfig(data_dir=tmp_path / "data")
+    config.ensure_directories()
+    if existing_file is not None:
+        (config.data_dir / existing_file).write_bytes(b"")
+    
+    assert Pipeline(config).hash_scheme == ("sha1" if legacy else HASH_SCHEME)
+
+
+def test_pipeline_hash_scheme_rejects_unknown_default(temp_config, monkeypatch):
+    """Test an unknown FEDLEDGER_HASH_SCHEME fails before it is recorded."""
+    import fedledger.pipeline as pipeline_module
+    from fedledger.ids import HASH_SCHEME_FILE
+    
+    monkeypatch.setattr(pipeline_module, "HASH_SCHEME", "md5")
+    with pytest.raises(ValueError, match="FEDLEDGER_HASH_SCHEME"):
+        Pipeline(temp_config)
+    assert not (temp_config.data_dir / HASH_SCHEME_FILE).exists()
+    
+    monkeypatch.undo()
+    temp_config.dry_run = True
+    Pipeline(temp_config)
+    assert not (temp_config.data_dir / HASH_SCHEME_FILE).exists()
+
+
+def test_pipeline_rerun_in_with_block(fixtures_dir, temp_config):
+    """Test reruns inside a with block keep Parquet and JSON outputs in step."""
+    files = Pipeline(temp_config).discover_local_files(fixtures_dir, "*.html")
+    
+    with Pipeline(temp_config) as pipeline:
+        pipeline.run(fixtures_dir, DocumentType.STATEMENT, "*.html", limit=1)
+        pipeline.run(fixtures_dir, DocumentType.STATEMENT, "*.html", limit=1)
+        pipeline.run(fixtures_dir, DocumentType.STATEMENT, "*.html", limit=2)
+    
+    parquet_ids = pq.read_table(
+        temp_config.processed_dir / "statement_documents.parquet", columns=["doc_id"]
+    ).column("doc_id").to_pylist()
+    metadata_path = temp_config.metadata_dir / "statement_metadata.json"
+    metadata = json.loads(metadata_path.read_text())
+    
+    expected = [generate_doc_id(f"file://{path}") for path in files[:2]]
+    assert sorted(parquet_ids) == sorted(expected)
+    assert [record["doc_id"] for record in metadata] == parquet_ids
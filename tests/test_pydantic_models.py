@@ -9,13 +9,16 @@ from fedledger.pydantic_models import (
     DocumentType,
 )
 
+# Fixed fetch time shared by every document built in this module
+_NOW = datetime(2024, 1, 1, 0, 0, 0)
+
 
 def test_base_document_creation():
     """Test creating a base document."""
     doc = BaseDocument(
         doc_id="abc1234567890def",
         source_url="https://www.federalreserve.gov/test.htm",
-        fetch_timestamp=datetime.utcnow(),
+        fetch_timestamp=_NOW,
         raw_path="data/raw/abc1234567890def.html",
         content_type="text/html",
         doc_type=DocumentType.STATEMENT,
@@ -35,7 +38,7 @@ def test_doc_id_validation():
     doc = BaseDocument(
         doc_id="abc1234567890def",
         source_url="https://test.com",
-        fetch_timestamp=datetime.utcnow(),
+        fetch_timestamp=_NOW,
         raw_path="test.html",
         content_type="text/html",
         doc_type=DocumentType.STATEMENT,
@@ -47,7 +50,7 @@ def test_doc_id_validation():
         BaseDocument(
             doc_id="abc123",
             source_url="https://test.com",
-            fetch_timestamp=datetime.utcnow(),
+            fetch_timestamp=_NOW,
             raw_path="test.html",
             content_type="text/html",
             doc_type=DocumentType.STATEMENT,
@@ -58,7 +61,7 @@ def test_doc_id_validation():
         BaseDocument(
             doc_id="xyz1234567890xyz",
             source_url="https://test.com",
-            fetch_timestamp=datetime.utcnow(),
+            fetch_timestamp=_NOW,
             raw_path="test.html",
             content_type="text/html",
             doc_type=DocumentType.STATEMENT,
@@ -70,7 +73,7 @@ def test_fomc_statement_model():
     stmt = FOMCStatementModel(
         doc_id="abc1234567890def",
         source_url="https://www.federalreserve.gov/statement.htm",
-        fetch_timestamp=datetime.utcnow(),
+        fetch_timestamp=_NOW,
         raw_path="data/raw/abc1234567890def.html",
         content_type="text/html",
         meeting_date=datetime(2024, 1, 31),
@@ -88,7 +91,7 @@ def test_speech_model():
     speech = SpeechModel(
         doc_id="abc1234567890def",
         source_url="https://www.federalreserve.gov/speech.htm",
-        fetch_timestamp=datetime.utcnow(),
+        fetch_timestamp=_NOW,
         raw_path="data/raw/abc1234567890def.html",
         content_type="text/html",
         speaker="Jerome Powell",
@@ -103,10 +106,10 @@ def test_speech_model():
 
 def test_to_parquet_row():
     """Test conversion to Parquet row format."""
-    doc = BaseDocument(
+    doc = BaseDocument.model_construct_trusted(
         doc_id="abc1234567890def",
         source_url="https://test.com",
-        fetch_timestamp=datetime.utcnow(),
+        fetch_timestamp=_NOW,
         raw_path="test.html",
         content_type="text/html",
         doc_type=DocumentType.STATEMENT,
@@ -123,10 +126,10 @@ def test_to_parquet_row():
 
 def test_to_json_metadata():
     """Test conversion to JSON metadata format."""
-    doc = BaseDocument(
+    doc = BaseDocument.model_construct_trusted(
         doc_id="abc1234567890def",
         source_url="https://test.com",
-        fetch_timestamp=datetime.utcnow(),
+        fetch_timestamp=_NOW,
         raw_path="test.html",
         content_type="text/html",
         doc_type=DocumentType.STATEMENT,
@@ -138,3 +141,90 @@ def test_to_json_metadata():
     assert metadata["doc_id"] == "abc1234567890def"
     assert metadata["title"] == "Test Document"
     assert isinstance(metadata, dict)
+
+
+def test_model_construct_trusted_matches_validated():
+    """Test trusted construction yields the same data as validation."""
+    fields = dict(
+        doc_id="abc1234567890def",
+        source_url="https://www.federalreserve.gov/test.htm",
+        fetch_timestamp=datetime(2024, 1, 31, 14, 0),
+        raw_path="data/raw/abc1234567890def.html",
+        content_type="text/html",
+        doc_type=DocumentType.STATEMENT,
+    )
+    
+    trusted = BaseDocument.model_construct_trusted(**fields)
+    validated = BaseDocument(**fields)
+    
+    assert trusted.model_dump() == validated.model_dump()
+    assert trusted.to_parquet_row() == validated.to_parquet_row()
+    assert type(trusted.doc_type) is str
+
+
+def test_models_are_frozen():
+    """Test documents reject assignment and reuse metadata column names."""
+    from pydantic import ValidationError
+    
+    doc = BaseDocument(
+        doc_id="abc1234567890def",
+        source_url="https://test.com",
+        fetch_timestamp=_NOW,
+        raw_path="test.html",
+        content_type="text/html",
+        doc_type=DocumentType.STATEMENT,
+        metadata={"vote": "10-0"},
+    )
+    
+    with pytest.raises(ValidationError, match="frozen"):
+        doc.title = "Changed"
+    
+    (key_a,) = [k for k in doc.to_parquet_row() if k.startswith("meta_")]
+    (key_b,) = [k for k in doc.to_parquet_row() if k.startswith("meta_")]
+    assert key_a == "meta_vote"
+    assert key_a is key_b
+
+
+def test_doc_id_normalized_and_url_required():
+    """Test uppercase doc_ids are lowercased and empty URLs rejected."""
+    from pydantic import ValidationError
+    
+    fields = dict(
+        doc_id="ABC1234567890DEF",
+        source_url="https://test.com",
+        fetch_timestamp=_NOW,
+        raw_path="test.html",
+        content_type="text/html",
+        doc_type=DocumentType.STATEMENT,
+    )
+    assert BaseDocument.from_raw_metadata(fields).doc_id == "abc1234567890def"
+    
+    with pytest.raises(ValidationError, match="source_url"):
+        BaseDocument(**{**fields, "source_url": ""})
+
+
+@pytest.mark.parametrize(
+    "doc_type, model",
+    [
+        ("statement", FOMCStatementModel),
+        ("speech", SpeechModel),
+        ("testimony", SpeechModel),
+        ("report", BaseDocument),
+    ],
+)
+def test_parse_document_metadata_dispatches_on_doc_type(doc_type, model):
+    """Test raw metadata is validated into the model for its doc_type."""
+    from fedledger.pydantic_models import parse_document_metadata
+    
+    doc = parse_document_metadata({
+        "doc_id": "abc1234567890def",
+        "source_url": "https://test.com",
+        "fetch_timestamp": "2024-01-31T14:00:00Z",
+        "raw_path": "test.html",
+        "content_type": "text/html",
+        "doc_type": doc_type,
+    })
+    
+    assert type(doc) is model
+    assert doc.doc_type == doc_type
+    assert parse_document_metadata(doc.to_json_metadata()) == doc
@@ -9,6 +9,9 @@ from fedledger.schema import (
     VALID_DOC_TYPES,
 )
 
+# Fixed fetch time shared by every document built in this module
+_NOW = datetime(2024, 1, 1, 0, 0, 0)
+
 
 def test_get_schema_for_doc_type():
     """Test schema retrieval for different document types."""
@@ -28,73 +31,43 @@ def test_invalid_doc_type():
         get_schema_for_doc_type("invalid_type")
 
 
-def test_validate_row_success():
-    """Test successful row validation."""
-    schema = get_schema_for_doc_type("statement")
-    
-    row = {
-        "doc_id": "abc1234567890def",
-        "source_url": "https://test.com",
-        "fetch_timestamp": datetime.utcnow(),
-        "raw_path": "test.html",
-        "content_type": "text/html",
-        "doc_type": "statement",
-    }
-    
-    # Should not raise
-    validate_row(row, schema)
-
-
-def test_validate_row_missing_required():
-    """Test validation fails on missing required field."""
-    schema = get_schema_for_doc_type("statement")
-    
-    row = {
-        "doc_id": "abc1234567890def",
-        # Missing source_url
-        "fetch_timestamp": datetime.utcnow(),
-        "raw_path": "test.html",
-        "content_type": "text/html",
-        "doc_type": "statement",
-    }
-    
-    with pytest.raises(ValueError, match="Required field missing"):
-        validate_row(row, schema)
-
-
-def test_validate_row_invalid_doc_type():
-    """Test validation fails on invalid doc_type value."""
-    schema = get_schema_for_doc_type("statement")
-    
-    row = {
-        "doc_id": "abc1234567890def",
-        "source_url": "https://test.com",
-        "fetch_timestamp": datetime.utcnow(),
-        "raw_path": "test.html",
-        "content_type": "text/html",
-        "doc_type": "invalid_type",
-    }
-    
-    with pytest.raises(ValueError, match="Invalid doc_type"):
-        validate_row(row, schema)
-
-
-def test_validate_row_invalid_doc_id():
-    """Test validation fails on invalid doc_id."""
+# Valid statement row; each validate_row case changes one field of it
+_VALID_ROW = {
+    "doc_id": "abc1234567890def",
+    "source_url": "https://test.com",
+    "fetch_timestamp": _NOW,
+    "raw_path": "test.html",
+    "content_type": "text/html",
+    "doc_type": "statement",
+}
+
+_MISSING = object()
+
+
+@pytest.mark.parametrize(
+    "field, value, message",
+    [
+        (None, None, None),
+        ("source_url", _MISSING, "Required field missing"),
+        ("doc_type", "invalid_type", "Invalid doc_type"),
+        ("doc_id", "abc123", "doc_id must be 16-character string"),
+    ],
+    ids=["valid", "missing_required", "invalid_doc_type", "invalid_doc_id"],
+)
+def test_validate_row(field, value, message):
+    """Test row validation accepts valid rows and reports the bad field."""
     schema = get_schema_for_doc_type("statement")
+    row = dict(_VALID_ROW)
+    if value is _MISSING:
+        del row[field]
+    elif field is not None:
+        row[field] = value
     
-    # Too short
-    row = {
-        "doc_id": "abc123",
-        "source_url": "https://test.com",
-        "fetch_timestamp": datetime.utcnow(),
-        "raw_path": "test.html",
-        "content_type": "text/html",
-        "doc_type": "statement",
-    }
-    
-    with pytest.raises(ValueError, match="doc_id must be 16-character string"):
+    if message is None:
         validate_row(row, schema)
+    else:
+        with pytest.raises(ValueError, match=message):
+            validate_row(row, schema)
 
 
 def test_validate_rows():
@@ -103,7 +76,7 @@ def test_validate_rows():
         {
             "doc_id": "abc1234567890def",
             "source_url": "https://test1.com",
-            "fetch_timestamp": datetime.utcnow(),
+            "fetch_timestamp": _NOW,
             "raw_path": "test1.html",
             "content_type": "text/html",
             "doc_type": "statement",
@@ -111,7 +84,7 @@ def test_validate_rows():
         {
             "doc_id": "def1234567890abc",
             "source_url": "https://test2.com",
-            "fetch_timestamp": datetime.utcnow(),
+            "fetch_timestamp": _NOW,
             "raw_path": "test2.html",
             "content_type": "text/html",
             "doc_type": "statement",
@@ -128,3 +101,143 @@ def test_valid_doc_types():
     assert "minutes" in VALID_DOC_TYPES
     assert "speech" in VALID_DOC_TYPES
     assert "press_conference" in VALID_DOC_TYPES
+
+
+def test_schema_lookup_cached():
+    """Test schema lookups return shared objects and cached field sets."""
+    from fedledger.schema import _schema_meta
+    
+    schema = get_schema_for_doc_type("statement")
+    assert get_schema_for_doc_type("STATEMENT") is schema
+    
+    required, nullable, names = _schema_meta(schema)
+    assert _schema_meta(schema)[0] is required
+    assert "doc_id" in required
+    assert "title" in nullable
+    assert names == required | nullable
+
+
+def test_validate_row_non_hex_doc_id():
+    """Test validation fails on a 16-character non-hex doc_id."""
+    schema = get_schema_for_doc_type("statement")
+    
+    row = {
+        "doc_id": "xyz1234567890xyz",
+        "source_url": "https://test.com",
+        "fetch_timestamp": _NOW,
+        "raw_path": "test.html",
+        "content_type": "text/html",
+        "doc_type": "statement",
+    }
+    
+    with pytest.raises(ValueError, match="doc_id must be hexadecimal"):
+        validate_row(row, schema)
+
+
+def _rows(n):
+    """Build n valid statement rows."""
+    return [
+        {
+            "doc_id": f"{i:016x}",
+            "source_url": f"https://test{i}.com",
+            "fetch_timestamp": datetime(2024, 1, 31, 14, 0),
+            "raw_path": f"test{i}.html",
+            "content_type": "text/html",
+            "doc_type": "statement",
+            "meta_extra": "dropped",
+        }
+        for i in range(n)
+    ]
+
+
+def test_validate_rows_returns_table():
+    """Test validated rows come back as a table with the schema applied."""
+    table = validate_rows(_rows(3), "statement")
+    
+    assert table.schema == get_schema_for_doc_type("statement")
+    assert table.num_rows == 3
+    assert table.column("doc_id").to_pylist() == [f"{i:016x}" for i in range(3)]
+    assert table.column("title").null_count == 3
+
+
+def test_validate_rows_complete_rows_match_partial_rows():
+    """Test rows carrying every schema field build the same table."""
+    schema = get_schema_for_doc_type("statement")
+    partial = _rows(3)
+    complete = [{name: row.get(name) for name in schema.names} for row in partial]
+    
+    table = validate_rows(complete, "statement")
+    assert table.equals(validate_rows(partial, "statement"))
+    
+    complete[1]["fetch_timestamp"] = "not a date"
+    with pytest.raises(ValueError, match="Row 1 validation failed"):
+        validate_rows(complete, "statement")
+
+
+@pytest.mark.parametrize(
+    "field, value, message",
+    [
+        ("doc_type", "invalid_type", "Row 2 validation failed: Invalid doc_type"),
+        (
+            "doc_id",
+            "xyz1234567890xyz",
+            "Row 2 validation failed: doc_id must be hexadecimal",
+        ),
+        (
+            "doc_id",
+            12345,
+            "Row 2 validation failed: doc_id must be 16-character string",
+        ),
+        ("fetch_timestamp", "not a date", "Row 2 validation failed"),
+        ("source_url", None, None),
+    ],
+)
+def test_validate_rows_reports_first_bad_row(field, value, message):
+    """Test the first invalid row is reported by index."""
+    rows = _rows(4)
+    rows[2][field] = value
+    rows[3][field] = value
+    
+    if message is None:
+        validate_rows(rows, "statement")
+        return
+    
+    with pytest.raises(ValueError, match=message):
+        validate_rows(rows, "statement")
+
+
+def test_validate_rows_missing_required():
+    """Test missing required fields are reported by index."""
+    rows = _rows(2)
+    del rows[1]["raw_path"]
+    
+    message = "Row 1 validation failed: Required field missing: raw_path"
+    with pytest.raises(ValueError, match=message):
+        validate_rows(rows, "statement")
+
+
+def _doc_id_buffers(table):
+    """Addresses of the buffers backing a table's doc_id column."""
+    return [b.address for b in table.column("doc_id").chunk(0).buffers() if b]
+
+
+def test_ensure_schema_compatibility():
+    """Test matching tables are returned as-is and others cast per column."""
+    import pyarrow as pa
+    from fedledger.schema import ensure_schema_compatibility
+    
+    schema = get_schema_for_doc_type("statement")
+    table = validate_rows(_rows(2), "statement")
+    assert ensure_schema_compatibility(table, schema) is table
+    
+    loose = table.set_column(
+        table.schema.get_field_index("fetch_timestamp"),
+        "fetch_timestamp",
+        table.column("fetch_timestamp").cast(pa.timestamp("ms", tz="UTC")),
+    )
+    fixed = ensure_schema_compatibility(loose, schema)
+    assert fixed.schema == schema
+    assert fixed.equals(table)
+    
+    # Columns that already matched share their buffers with the input
+    assert _doc_id_buffers(fixed) == _doc_id_buffers(table)